@@ -0,0 +1,41 @@
+"""Add load_stats materialized view
+
+Revision ID: 4d8b2e7f1a63
+Revises: 6a2f1d8e5c90
+Create Date: 2025-06-12 10:04:37.512906
+
+"""
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel.sql.sqltypes
+
+
+# revision identifiers, used by Alembic.
+revision = '4d8b2e7f1a63'
+down_revision = '6a2f1d8e5c90'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # The jumptype enum stores member names. IF NOT EXISTS: databases built
+    # while the view was revision 0c5e9a7d4b83 still have the same view
+    op.execute(
+        """
+        CREATE MATERIALIZED VIEW IF NOT EXISTS load_stats AS
+        SELECT load_id,
+               count(*) AS total,
+               count(*) FILTER (WHERE jump_type = 'TANDEM') AS tandems,
+               count(*) FILTER (WHERE jump_type = 'AFF') AS affs,
+               count(*) FILTER (WHERE jump_type = 'FUN_JUMPER') AS fun_jumpers
+        FROM jump
+        GROUP BY load_id
+        """
+    )
+    # REFRESH ... CONCURRENTLY needs a unique index covering every row
+    op.create_index('ix_load_stats_load_id', 'load_stats', ['load_id'], unique=True, if_not_exists=True)
+
+
+def downgrade():
+    op.drop_index('ix_load_stats_load_id', table_name='load_stats')
+    op.execute("DROP MATERIALIZED VIEW load_stats")
@@ -0,0 +1,35 @@
+"""Add jump_type_daily materialized view
+
+Revision ID: 5b9e3c7a2d14
+Revises: 8a1d5e6f0b27
+Create Date: 2025-06-09 09:21:05.338170
+
+"""
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel.sql.sqltypes
+
+
+# revision identifiers, used by Alembic.
+revision = '5b9e3c7a2d14'
+down_revision = '8a1d5e6f0b27'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.execute(
+        """
+        CREATE MATERIALIZED VIEW jump_type_daily AS
+        SELECT date(load.scheduled_time) AS day, jump.jump_type, count(*) AS count
+        FROM jump JOIN load ON load.id = jump.load_id
+        GROUP BY date(load.scheduled_time), jump.jump_type
+        """
+    )
+    # REFRESH ... CONCURRENTLY needs a unique index covering every row
+    op.create_index('ix_jump_type_daily_day_jump_type', 'jump_type_daily', ['day', 'jump_type'], unique=True)
+
+
+def downgrade():
+    op.drop_index('ix_jump_type_daily_day_jump_type', table_name='jump_type_daily')
+    op.execute("DROP MATERIALIZED VIEW jump_type_daily")
@@ -1,16 +1,17 @@
-from collections.abc import Generator
+from collections.abc import Callable, Generator
 from typing import Annotated
 
 import jwt
-from fastapi import Depends, HTTPException, status
+from fastapi import BackgroundTasks, Depends, HTTPException, Request, status
 from fastapi.security import OAuth2PasswordBearer
 from jwt.exceptions import InvalidTokenError
 from pydantic import ValidationError
 from sqlmodel import Session
 
 from app.core import security
+from app.core.cache import cache
 from app.core.config import settings
-from app.core.db import engine
+from app.core.db import engine, refresh_jump_views
 from app.models import TokenPayload, User
 
 reusable_oauth2 = OAuth2PasswordBearer(
@@ -55,3 +56,23 @@ def get_current_active_superuser(current_user: CurrentUser) -> User:
             status_code=403, detail="The user doesn't have enough privileges"
         )
     return current_user
+
+
+def invalidates_cache(
+    *namespaces: str,
+) -> Callable[[Request], Generator[None, None, None]]:
+    """Router dependency that drops cached results after a successful write."""
+
+    def invalidate(request: Request) -> Generator[None, None, None]:
+        yield
+        if request.method not in ("GET", "HEAD"):
+            for namespace in namespaces:
+                cache.clear(namespace)
+
+    return invalidate
+
+
+def refreshes_jump_views(request: Request, background_tasks: BackgroundTasks) -> None:
+    """Router dependency that refreshes the jump views once a write has responded."""
+    if request.method not in ("GET", "HEAD"):
+        background_tasks.add_task(refresh_jump_views)
@@ -1,5 +1,6 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends
 
+from app.api.deps import invalidates_cache, refreshes_jump_views
 from app.api.routes import items, login, private, users, utils, aircraft, instructors, loads, jumps, weather, analytics
 from app.core.config import settings
 
@@ -10,11 +11,17 @@ api_router.include_router(utils.router)
 api_router.include_router(items.router)
 
 # Skydiving organizer routes
-api_router.include_router(aircraft.router, prefix="/aircraft", tags=["aircraft"])
+# Writes to anything the analytics endpoints aggregate drop their cached results
+invalidates_analytics = [Depends(invalidates_cache("analytics"))]
+# Loads and jumps feed the jump_type_daily and load_stats materialized views
+refreshes_jump_stats = [Depends(refreshes_jump_views)]
+# Weather writes also drop the cached current report
+invalidates_weather = [Depends(invalidates_cache("analytics", "weather"))]
+api_router.include_router(aircraft.router, prefix="/aircraft", tags=["aircraft"], dependencies=invalidates_analytics)
 api_router.include_router(instructors.router, prefix="/instructors", tags=["instructors"])
-api_router.include_router(loads.router, prefix="/loads", tags=["loads"])
-api_router.include_router(jumps.router, prefix="/jumps", tags=["jumps"])
-api_router.include_router(weather.router, prefix="/weather", tags=["weather"])
+api_router.include_router(loads.router, prefix="/loads", tags=["loads"], dependencies=invalidates_analytics + refreshes_jump_stats)
+api_router.include_router(jumps.router, prefix="/jumps", tags=["jumps"], dependencies=invalidates_analytics + refreshes_jump_stats)
+api_router.include_router(weather.router, prefix="/weather", tags=["weather"], dependencies=invalidates_weather)
 api_router.include_router(analytics.router, prefix="/analytics", tags=["analytics"])
 
 
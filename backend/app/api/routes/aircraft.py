@@ -2,10 +2,12 @@ import uuid
 from typing import Any
 
 from fastapi import APIRouter, HTTPException
-from sqlmodel import func, select
+from fastapi.responses import ORJSONResponse
+from sqlalchemy.exc import IntegrityError
+from sqlmodel import col, delete, select, update
 
 from app.api.deps import CurrentUser, SessionDep
-from app.models import Aircraft, AircraftCreate, AircraftPublic, AircraftUpdate, Message
+from app.models import Aircraft, AircraftCreate, AircraftPublic, AircraftUpdate, Load, Message
 from app import crud
 
 router = APIRouter()
@@ -19,7 +21,9 @@ def read_aircraft(
     Retrieve aircraft.
     """
     aircrafts = crud.get_aircrafts(session=session, skip=skip, limit=limit)
-    return aircrafts
+    # A returned response skips FastAPI's response_model validation, which
+    # the decorator keeps declaring for the OpenAPI schema
+    return ORJSONResponse(aircrafts)
 
 
 @router.get("/{id}", response_model=AircraftPublic)
@@ -40,19 +44,17 @@ def create_aircraft(
     """
     Create new aircraft.
     """
-    # Check for duplicate registration
-    existing = session.exec(
-        select(Aircraft).where(Aircraft.registration == aircraft_in.registration)
-    ).first()
-    if existing:
+    aircraft = Aircraft.model_validate(aircraft_in)
+    session.add(aircraft)
+    try:
+        session.commit()
+    except IntegrityError:
+        # Duplicate registrations are rejected by the unique index
+        session.rollback()
         raise HTTPException(
             status_code=400, 
             detail="Aircraft with this registration already exists"
         )
-    
-    aircraft = Aircraft.model_validate(aircraft_in)
-    session.add(aircraft)
-    session.commit()
     session.refresh(aircraft)
     return aircraft
 
@@ -68,27 +70,26 @@ def update_aircraft(
     """
     Update an aircraft.
     """
-    aircraft = session.get(Aircraft, id)
-    if not aircraft:
-        raise HTTPException(status_code=404, detail="Aircraft not found")
-    
-    # Check for duplicate registration if being updated
-    if aircraft_in.registration and aircraft_in.registration != aircraft.registration:
-        existing = session.exec(
-            select(Aircraft).where(Aircraft.registration == aircraft_in.registration)
-        ).first()
-        if existing:
+    update_dict = aircraft_in.model_dump(exclude_unset=True)
+    if update_dict:
+        # UPDATE ... RETURNING finds, changes and returns the row in one statement
+        statement = update(Aircraft).where(col(Aircraft.id) == id).values(**update_dict).returning(Aircraft)
+        try:
+            aircraft = session.execute(statement).scalar_one_or_none()
+        except IntegrityError:
+            session.rollback()
             raise HTTPException(
                 status_code=400, 
                 detail="Aircraft with this registration already exists"
             )
-    
-    update_dict = aircraft_in.model_dump(exclude_unset=True)
-    aircraft.sqlmodel_update(update_dict)
-    session.add(aircraft)
+    else:
+        aircraft = session.get(Aircraft, id)
+    if not aircraft:
+        raise HTTPException(status_code=404, detail="Aircraft not found")
+    # Serialize before the commit expires the row, which would cost a reload SELECT
+    public = AircraftPublic.model_validate(aircraft)
     session.commit()
-    session.refresh(aircraft)
-    return aircraft
+    return public
 
 
 @router.delete("/{id}")
@@ -98,20 +99,20 @@ def delete_aircraft(
     """
     Delete an aircraft.
     """
-    aircraft = session.get(Aircraft, id)
-    if not aircraft:
-        raise HTTPException(status_code=404, detail="Aircraft not found")
-    
     # Check if aircraft has any loads
-    loads_count = session.exec(
-        select(func.count()).select_from(Aircraft).where(Aircraft.id == id)
-    ).one()
-    if loads_count > 0:
+    has_loads = session.exec(
+        select(Load.id).where(Load.aircraft_id == id).limit(1)
+    ).first()
+    if has_loads:
         raise HTTPException(
             status_code=400, 
             detail="Cannot delete aircraft with existing loads"
         )
     
-    session.delete(aircraft)
+    deleted_id = session.execute(
+        delete(Aircraft).where(col(Aircraft.id) == id).returning(col(Aircraft.id))
+    ).scalar_one_or_none()
+    if not deleted_id:
+        raise HTTPException(status_code=404, detail="Aircraft not found")
     session.commit()
     return Message(message="Aircraft deleted successfully")
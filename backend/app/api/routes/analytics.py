@@ -1,27 +1,47 @@
+from collections.abc import Sequence
 from typing import Any
 import uuid
-from datetime import datetime, date
+from datetime import datetime, date, time, timedelta
 
-from fastapi import APIRouter
+from fastapi import APIRouter, HTTPException
 from sqlmodel import select
 
 from app.api.deps import CurrentUser, SessionDep
+from app.core.cache import cached
+from app.core.config import settings
+from app.models import LoadSummary
 from app import crud
 
 router = APIRouter()
 
 
 @router.get("/load-statistics")
+@cached("analytics", ttl=settings.ANALYTICS_CACHE_TTL_SECONDS)
 def get_load_statistics(
     session: SessionDep, current_user: CurrentUser
 ) -> dict[str, Any]:
     """
     Get load statistics and analytics.
     """
-    stats = crud.get_load_statistics(session=session)
+    # Every counter is a FILTER clause on the same statement; add new ones
+    # there rather than issuing another query per status
+    stats = crud.get_load_status_statistics(session=session)
     return stats
 
 
+@router.get("/load-statistics/{load_id}", response_model=LoadSummary)
+def get_load_summary(
+    session: SessionDep, current_user: CurrentUser, load_id: uuid.UUID
+) -> Any:
+    """
+    Get jump counts, capacity utilization and revenue estimate for one load.
+    """
+    summary = crud.get_load_statistics(session=session, load_id=load_id)
+    if summary is None:
+        raise HTTPException(status_code=404, detail="Load not found")
+    return summary
+
+
 @router.get("/revenue-estimate")
 def get_revenue_estimate(
     session: SessionDep, current_user: CurrentUser, load_id: uuid.UUID
@@ -42,50 +62,55 @@ def get_instructor_workload(
     """
     if instructor_id:
         workload = crud.get_instructor_workload(session=session, instructor_id=instructor_id)
+        if workload is None:
+            raise HTTPException(status_code=404, detail="Instructor not found")
         return {"instructor_id": instructor_id, "workload": workload}
     else:
-        # Get workload for all instructors
-        from app.models import Instructor
-        statement = select(Instructor)
-        instructors = session.exec(statement).all()
-        workloads = {}
-        for instructor in instructors:
-            workloads[str(instructor.id)] = crud.get_instructor_workload(session=session, instructor_id=instructor.id)
+        # Get workload for all instructors in one aggregate query
+        workloads = crud.get_instructor_workloads(session=session)
         return {"all_instructors_workload": workloads}
 
 
 @router.get("/daily-capacity/{target_date}")
+@cached("analytics", ttl=settings.ANALYTICS_CACHE_TTL_SECONDS)
 def get_daily_capacity(
     session: SessionDep, current_user: CurrentUser, target_date: date
 ) -> dict[str, Any]:
     """
     Get daily capacity utilization for a specific date.
     """
-    from app.models import Load, Aircraft
-    from sqlmodel import func
-    
-    # Get all loads for the target date
-    statement = select(Load).where(func.date(Load.scheduled_time) == target_date)
-    loads = session.exec(statement).all()
+    from app.models import Load, Aircraft, load_stats
+    from sqlmodel import col, func
+
+    # A half-open range on the raw column keeps the scheduled_time index usable
+    day_start = datetime.combine(target_date, time.min)
+
+    # One round-trip: each load on the target date with its aircraft and the
+    # jumper count precomputed in load_stats
+    statement = (
+        select(Load.id, Aircraft.registration, Aircraft.capacity, func.coalesce(load_stats.c.total, 0))
+        .join(Aircraft, col(Aircraft.id) == Load.aircraft_id)
+        .outerjoin(load_stats, load_stats.c.load_id == Load.id)
+        .where(Load.scheduled_time >= day_start, Load.scheduled_time < day_start + timedelta(days=1))
+    )
+    rows = session.exec(statement).all()
+    # Nothing below touches the database, so hand the connection back to the pool
+    session.close()
     
     total_capacity = 0
     total_used = 0
     loads_info = []
     
-    for load in loads:
-        aircraft = session.get(Aircraft, load.aircraft_id)
-        if aircraft:
-            capacity_info = crud.get_load_capacity_info(session=session, load_id=load.id)
-            if capacity_info:
-                total_capacity += aircraft.capacity
-                total_used += capacity_info["current_jumpers"]
-                loads_info.append({
-                    "load_id": load.id,
-                    "aircraft": aircraft.registration,
-                    "capacity": aircraft.capacity,
-                    "used": capacity_info["current_jumpers"],
-                    "utilization": capacity_info["utilization_percentage"]
-                })
+    for load_id, registration, capacity, used in rows:
+        total_capacity += capacity
+        total_used += used
+        loads_info.append({
+            "load_id": load_id,
+            "aircraft": registration,
+            "capacity": capacity,
+            "used": used,
+            "utilization": (used / capacity * 100) if capacity > 0 else 0
+        })
     
     overall_utilization = (total_used / total_capacity * 100) if total_capacity > 0 else 0
     
@@ -99,29 +124,33 @@ def get_daily_capacity(
 
 
 @router.get("/jump-type-distribution")
+@cached("analytics", ttl=settings.ANALYTICS_CACHE_TTL_SECONDS)
 def get_jump_type_distribution(
     session: SessionDep, current_user: CurrentUser, start_date: date | None = None, end_date: date | None = None
 ) -> dict[str, Any]:
     """
     Get distribution of jump types over a date range.
     """
-    from app.models import Jump, JumpType
+    from app.models import jump_type_daily
     from sqlmodel import func
     
-    statement = select(Jump.jump_type, func.count(Jump.id).label('count')).group_by(Jump.jump_type)
+    # Summing the precomputed per-day counts costs O(days), not O(jumps)
+    statement = select(
+        jump_type_daily.c.jump_type, func.sum(jump_type_daily.c.count)
+    ).group_by(jump_type_daily.c.jump_type)
     
     if start_date:
-        statement = statement.join(Load).where(func.date(Load.scheduled_time) >= start_date)
+        statement = statement.where(jump_type_daily.c.day >= start_date)
     if end_date:
-        statement = statement.join(Load).where(func.date(Load.scheduled_time) <= end_date)
+        statement = statement.where(jump_type_daily.c.day <= end_date)
     
     results = session.exec(statement).all()
     
     distribution = {}
     total_jumps = 0
     for jump_type, count in results:
-        distribution[jump_type.value] = count
-        total_jumps += count
+        distribution[jump_type.value] = int(count)
+        total_jumps += int(count)
     
     # Calculate percentages
     percentages = {}
@@ -137,59 +166,67 @@ def get_jump_type_distribution(
 
 
 @router.get("/weather-impact")
+@cached("analytics", ttl=settings.ANALYTICS_CACHE_TTL_SECONDS)
 def get_weather_impact(
-    session: SessionDep, current_user: CurrentUser, days: int = 7
+    session: SessionDep, current_user: CurrentUser, days: int = 7, include_conditions: bool = False
 ) -> dict[str, Any]:
     """
     Get weather impact on jumping operations over the last N days.
     """
-    from app.models import WeatherReport, Load
-    from sqlmodel import func
-    from datetime import timedelta
+    from app.models import WeatherReport
+    from sqlmodel import col, func
     
     end_date = datetime.now().date()
     start_date = end_date - timedelta(days=days)
-    
-    # Get weather reports in date range
-    weather_statement = select(WeatherReport).where(
-        func.date(WeatherReport.date) >= start_date,
-        func.date(WeatherReport.date) <= end_date
+    in_range = (
+        WeatherReport.date >= datetime.combine(start_date, time.min),
+        WeatherReport.date < datetime.combine(end_date + timedelta(days=1), time.min)
     )
-    weather_reports = session.exec(weather_statement).all()
     
-    # Count suitable vs unsuitable days
-    suitable_days = 0
-    tandem_suitable_days = 0
-    student_suitable_days = 0
+    # A day is suitable for a jump type if any of its reports was
+    report_day = func.date(WeatherReport.date).label("report_day")
+    daily_statement = select(
+        report_day,
+        func.bool_or(WeatherReport.suitable_for_tandems),
+        func.bool_or(WeatherReport.suitable_for_students),
+        func.bool_or(WeatherReport.suitable_for_fun_jumpers)
+    ).where(*in_range).group_by(report_day)
+
+    daily_rows = session.exec(daily_statement).all()
+
+    # Per-report detail is only fetched when asked for
+    condition_rows: Sequence[Any] = []
+    if include_conditions:
+        conditions_statement = select(
+            WeatherReport.date, WeatherReport.condition, WeatherReport.wind_speed, WeatherReport.visibility
+        ).where(*in_range).order_by(col(WeatherReport.date))
+        condition_rows = session.exec(conditions_statement).all()
+    # Nothing below touches the database, so hand the connection back to the pool
+    session.close()
     
     daily_weather = {}
-    for report in weather_reports:
-        report_date = report.date.date()
-        if report_date not in daily_weather:
-            daily_weather[report_date] = {
-                "tandem_suitable": False,
-                "student_suitable": False,
-                "fun_jumper_suitable": False,
-                "conditions": []
-            }
-        
-        daily_weather[report_date]["tandem_suitable"] = daily_weather[report_date]["tandem_suitable"] or report.suitable_for_tandems
-        daily_weather[report_date]["student_suitable"] = daily_weather[report_date]["student_suitable"] or report.suitable_for_students
-        daily_weather[report_date]["fun_jumper_suitable"] = daily_weather[report_date]["fun_jumper_suitable"] or report.suitable_for_fun_jumpers
-        daily_weather[report_date]["conditions"].append({
-            "time": report.date,
-            "conditions": report.condition.value,
-            "wind_speed": report.wind_speed,
-            "visibility": report.visibility
+    for report_date, tandem_suitable, student_suitable, fun_jumper_suitable in daily_rows:
+        daily_weather[report_date] = {
+            "tandem_suitable": tandem_suitable,
+            "student_suitable": student_suitable,
+            "fun_jumper_suitable": fun_jumper_suitable
+        }
+        if include_conditions:
+            daily_weather[report_date]["conditions"] = []
+    for report_time, condition, wind_speed, visibility in condition_rows:
+        daily_weather[report_time.date()]["conditions"].append({
+            "time": report_time,
+            "conditions": condition.value,
+            "wind_speed": wind_speed,
+            "visibility": visibility
         })
     
-    for day_data in daily_weather.values():
-        if day_data["tandem_suitable"]:
-            tandem_suitable_days += 1
-        if day_data["student_suitable"]:
-            student_suitable_days += 1
-        if day_data["tandem_suitable"] and day_data["student_suitable"] and day_data["fun_jumper_suitable"]:
-            suitable_days += 1
+    tandem_suitable_days = sum(1 for day_data in daily_weather.values() if day_data["tandem_suitable"])
+    student_suitable_days = sum(1 for day_data in daily_weather.values() if day_data["student_suitable"])
+    suitable_days = sum(
+        1 for day_data in daily_weather.values()
+        if day_data["tandem_suitable"] and day_data["student_suitable"] and day_data["fun_jumper_suitable"]
+    )
     
     return {
         "date_range": {"start": start_date, "end": end_date, "days": days},
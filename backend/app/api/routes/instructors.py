@@ -2,10 +2,10 @@ from typing import Any
 import uuid
 
 from fastapi import APIRouter, HTTPException
-from sqlmodel import func, select
+from sqlmodel import col, delete, select, update
 
 from app.api.deps import CurrentUser, SessionDep
-from app.models import Instructor, InstructorCreate, InstructorPublic, InstructorUpdate, InstructorsPublic, Message
+from app.models import Instructor, InstructorCreate, InstructorPublic, InstructorUpdate, InstructorsPublic, Jump, Message
 from app import crud
 
 router = APIRouter()
@@ -19,11 +19,8 @@ def read_instructors(
     Retrieve instructors.
     """
 
-    count_statement = select(func.count()).select_from(Instructor)
-    count = session.exec(count_statement).one()
-
-    statement = select(Instructor).offset(skip).limit(limit)
-    instructors = session.exec(statement).all()
+    statement = select(Instructor)
+    instructors, count = crud.get_page(session=session, statement=statement, skip=skip, limit=limit)
 
     return InstructorsPublic(data=instructors, count=count)
 
@@ -46,7 +43,7 @@ def create_instructor(
     """
     Create new instructor.
     """
-    instructor = crud.create_instructor(session=session, instructor_create=instructor_in)
+    instructor = crud.create_instructor(session=session, instructor_in=instructor_in)
     return instructor
 
 
@@ -61,16 +58,19 @@ def update_instructor(
     """
     Update an instructor.
     """
-    instructor = session.get(Instructor, id)
+    update_dict = instructor_in.model_dump(exclude_unset=True)
+    if update_dict:
+        # UPDATE ... RETURNING finds, changes and returns the row in one statement
+        statement = update(Instructor).where(col(Instructor.id) == id).values(**update_dict).returning(Instructor)
+        instructor = session.execute(statement).scalar_one_or_none()
+    else:
+        instructor = session.get(Instructor, id)
     if not instructor:
         raise HTTPException(status_code=404, detail="Instructor not found")
-    
-    update_dict = instructor_in.model_dump(exclude_unset=True)
-    instructor.sqlmodel_update(update_dict)
-    session.add(instructor)
+    # Serialize before the commit expires the row, which would cost a reload SELECT
+    public = InstructorPublic.model_validate(instructor)
     session.commit()
-    session.refresh(instructor)
-    return instructor
+    return public
 
 
 @router.delete("/{id}")
@@ -80,10 +80,14 @@ def delete_instructor(
     """
     Delete an instructor.
     """
-    instructor = session.get(Instructor, id)
-    if not instructor:
+    # Unassign the instructor's jumps, as the ORM delete used to
+    session.execute(update(Jump).where(col(Jump.instructor_id) == id).values(instructor_id=None))
+    deleted_id = session.execute(
+        delete(Instructor).where(col(Instructor.id) == id).returning(col(Instructor.id))
+    ).scalar_one_or_none()
+    if not deleted_id:
+        session.rollback()
         raise HTTPException(status_code=404, detail="Instructor not found")
-    session.delete(instructor)
     session.commit()
     return Message(message="Instructor deleted successfully")
 
@@ -95,8 +99,8 @@ def read_tandem_instructors(
     """
     Retrieve tandem-certified instructors.
     """
-    instructors = crud.get_tandem_instructors(session=session, skip=skip, limit=limit)
-    count = len(instructors)
+    statement = crud.active_instructors_statement(tandem_only=True)
+    instructors, count = crud.get_page(session=session, statement=statement, skip=skip, limit=limit)
     return InstructorsPublic(data=instructors, count=count)
 
 
@@ -107,6 +111,6 @@ def read_aff_instructors(
     """
     Retrieve AFF-certified instructors.
     """
-    instructors = crud.get_aff_instructors(session=session, skip=skip, limit=limit)
-    count = len(instructors)
+    statement = crud.active_instructors_statement(aff_only=True)
+    instructors, count = crud.get_page(session=session, statement=statement, skip=skip, limit=limit)
     return InstructorsPublic(data=instructors, count=count)
@@ -2,7 +2,8 @@ from typing import Any
 import uuid
 
 from fastapi import APIRouter, HTTPException
-from sqlmodel import func, select
+from sqlalchemy.orm import raiseload, selectinload
+from sqlmodel import col, delete, select, update
 
 from app.api.deps import CurrentUser, SessionDep
 from app.models import Jump, JumpCreate, JumpPublic, JumpUpdate, JumpsPublic, Message, JumpType
@@ -10,6 +11,9 @@ from app import crud
 
 router = APIRouter()
 
+# Pre-fetch what the public model serializes; anything else raises instead of lazy loading
+_LIST_OPTIONS = (selectinload(Jump.instructor), raiseload("*"))  # type: ignore[arg-type]
+
 
 @router.get("/", response_model=JumpsPublic)
 def read_jumps(
@@ -19,11 +23,8 @@ def read_jumps(
     Retrieve jumps.
     """
 
-    count_statement = select(func.count()).select_from(Jump)
-    count = session.exec(count_statement).one()
-
-    statement = select(Jump).offset(skip).limit(limit)
-    jumps = session.exec(statement).all()
+    statement = select(Jump).options(*_LIST_OPTIONS)
+    jumps, count = crud.get_page(session=session, statement=statement, skip=skip, limit=limit)
 
     return JumpsPublic(data=jumps, count=count)
 
@@ -47,12 +48,26 @@ def create_jump(
     Create new jump.
     """
     try:
-        jump = crud.create_jump(session=session, jump_create=jump_in)
+        jump = crud.create_jump(session=session, jump_in=jump_in)
         return jump
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
 
+@router.post("/bulk")
+def create_jumps(
+    *, session: SessionDep, current_user: CurrentUser, jumps_in: list[JumpCreate]
+) -> Message:
+    """
+    Create several jumps in one transaction.
+    """
+    try:
+        created = crud.create_jumps(session=session, jumps_in=jumps_in)
+        return Message(message=f"{created} jumps created successfully")
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
 @router.put("/{id}", response_model=JumpPublic)
 def update_jump(
     *,
@@ -64,16 +79,29 @@ def update_jump(
     """
     Update a jump.
     """
-    jump = session.get(Jump, id)
+    update_dict = jump_in.model_dump(exclude_unset=True)
+    if update_dict:
+        # UPDATE ... RETURNING finds, changes and returns the row in one statement
+        statement = (
+            update(Jump).where(col(Jump.id) == id).values(**update_dict)
+            .returning(Jump).options(*_LIST_OPTIONS)
+        )
+        jump = session.execute(statement).scalar_one_or_none()
+    else:
+        jump = session.get(Jump, id, options=_LIST_OPTIONS)
     if not jump:
         raise HTTPException(status_code=404, detail="Jump not found")
-    
-    update_dict = jump_in.model_dump(exclude_unset=True)
-    jump.sqlmodel_update(update_dict)
-    session.add(jump)
+    if "instructor_id" in update_dict or "jump_type" in update_dict:
+        # Checked on the returned row, so no read of the old one is needed
+        try:
+            crud.check_jump_instructor(session=session, jump=jump)
+        except ValueError as e:
+            session.rollback()
+            raise HTTPException(status_code=400, detail=str(e))
+    # Serialize before the commit expires the row, which would cost a reload SELECT
+    public = JumpPublic.model_validate(jump)
     session.commit()
-    session.refresh(jump)
-    return jump
+    return public
 
 
 @router.delete("/{id}")
@@ -83,10 +111,11 @@ def delete_jump(
     """
     Delete a jump.
     """
-    jump = session.get(Jump, id)
-    if not jump:
+    deleted_id = session.execute(
+        delete(Jump).where(col(Jump.id) == id).returning(col(Jump.id))
+    ).scalar_one_or_none()
+    if not deleted_id:
         raise HTTPException(status_code=404, detail="Jump not found")
-    session.delete(jump)
     session.commit()
     return Message(message="Jump deleted successfully")
 
@@ -98,9 +127,8 @@ def read_jumps_by_type(
     """
     Retrieve jumps by type.
     """
-    statement = select(Jump).where(Jump.jump_type == jump_type).offset(skip).limit(limit)
-    jumps = session.exec(statement).all()
-    count = len(jumps)
+    statement = select(Jump).options(*_LIST_OPTIONS).where(Jump.jump_type == jump_type)
+    jumps, count = crud.get_page(session=session, statement=statement, skip=skip, limit=limit)
     return JumpsPublic(data=jumps, count=count)
 
 
@@ -111,9 +139,8 @@ def read_jumps_by_load(
     """
     Retrieve jumps for a specific load.
     """
-    statement = select(Jump).where(Jump.load_id == load_id).offset(skip).limit(limit)
-    jumps = session.exec(statement).all()
-    count = len(jumps)
+    statement = select(Jump).options(*_LIST_OPTIONS).where(Jump.load_id == load_id).order_by(col(Jump.exit_order))
+    jumps, count = crud.get_page(session=session, statement=statement, skip=skip, limit=limit)
     return JumpsPublic(data=jumps, count=count)
 
 
@@ -124,9 +151,8 @@ def read_jumps_by_instructor(
     """
     Retrieve jumps for a specific instructor.
     """
-    statement = select(Jump).where(Jump.instructor_id == instructor_id).offset(skip).limit(limit)
-    jumps = session.exec(statement).all()
-    count = len(jumps)
+    statement = select(Jump).options(*_LIST_OPTIONS).where(Jump.instructor_id == instructor_id)
+    jumps, count = crud.get_page(session=session, statement=statement, skip=skip, limit=limit)
     return JumpsPublic(data=jumps, count=count)
 
 
@@ -137,9 +163,8 @@ def read_tandem_jumps(
     """
     Retrieve tandem jumps.
     """
-    statement = select(Jump).where(Jump.jump_type == JumpType.TANDEM).offset(skip).limit(limit)
-    jumps = session.exec(statement).all()
-    count = len(jumps)
+    statement = select(Jump).options(*_LIST_OPTIONS).where(Jump.jump_type == JumpType.TANDEM)
+    jumps, count = crud.get_page(session=session, statement=statement, skip=skip, limit=limit)
     return JumpsPublic(data=jumps, count=count)
 
 
@@ -150,9 +175,8 @@ def read_aff_jumps(
     """
     Retrieve AFF jumps.
     """
-    statement = select(Jump).where(Jump.jump_type == JumpType.AFF).offset(skip).limit(limit)
-    jumps = session.exec(statement).all()
-    count = len(jumps)
+    statement = select(Jump).options(*_LIST_OPTIONS).where(Jump.jump_type == JumpType.AFF)
+    jumps, count = crud.get_page(session=session, statement=statement, skip=skip, limit=limit)
     return JumpsPublic(data=jumps, count=count)
 
 
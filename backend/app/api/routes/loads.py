@@ -1,32 +1,58 @@
 from typing import Any
 import uuid
-from datetime import datetime
+from datetime import datetime, time, timedelta
 
 from fastapi import APIRouter, HTTPException
-from sqlmodel import func, select
+from sqlalchemy.orm import joinedload, raiseload, selectinload
+from sqlmodel import col, delete, select, update
 
 from app.api.deps import CurrentUser, SessionDep
-from app.models import Load, LoadCreate, LoadPublic, LoadUpdate, LoadsPublic, Message, LoadStatus
+from app.models import Jump, Load, LoadCreate, LoadPublic, LoadUpdate, LoadsPublic, Message, LoadStatus
 from app import crud
 
 router = APIRouter()
 
+# Pre-fetch what the public model serializes: a JOIN for the aircraft, then one
+# IN query for all the jumps and their instructors. Anything else raises
+# instead of lazy loading
+_LIST_OPTIONS = (
+    joinedload(Load.aircraft),  # type: ignore[arg-type]
+    selectinload(Load.jumps).joinedload(Jump.instructor),  # type: ignore[arg-type]
+    raiseload("*"),
+)
+# RETURNING rows cannot carry a JOIN, so updates fetch the aircraft with an IN query too
+_RETURNING_OPTIONS = (
+    selectinload(Load.aircraft),  # type: ignore[arg-type]
+    selectinload(Load.jumps).joinedload(Jump.instructor),  # type: ignore[arg-type]
+)
+
 
 @router.get("/", response_model=LoadsPublic)
 def read_loads(
-    session: SessionDep, current_user: CurrentUser, skip: int = 0, limit: int = 100
+    session: SessionDep,
+    current_user: CurrentUser,
+    skip: int = 0,
+    limit: int = 100,
+    cursor: str | None = None,
 ) -> Any:
     """
-    Retrieve loads.
+    Retrieve loads by scheduled time. Pass the returned next_cursor to get the following page; cursor pages come without a count.
     """
 
-    count_statement = select(func.count()).select_from(Load)
-    count = session.exec(count_statement).one()
-
-    statement = select(Load).offset(skip).limit(limit)
-    loads = session.exec(statement).all()
+    statement = select(Load).options(*_LIST_OPTIONS)
+    try:
+        loads, count, next_cursor = crud.get_cursor_page(
+            session=session,
+            statement=statement,
+            order_by=(Load.scheduled_time, Load.id),
+            cursor=cursor,
+            skip=skip,
+            limit=limit,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
-    return LoadsPublic(data=loads, count=count)
+    return LoadsPublic(data=loads, count=count, next_cursor=next_cursor)
 
 
 @router.get("/{id}", response_model=LoadPublic)
@@ -47,7 +73,7 @@ def create_load(
     """
     Create new load.
     """
-    load = crud.create_load(session=session, load_create=load_in)
+    load = crud.create_load(session=session, load_in=load_in)
     return load
 
 
@@ -62,16 +88,22 @@ def update_load(
     """
     Update a load.
     """
-    load = session.get(Load, id)
+    update_dict = load_in.model_dump(exclude_unset=True)
+    if update_dict:
+        # UPDATE ... RETURNING finds, changes and returns the row in one statement
+        statement = (
+            update(Load).where(col(Load.id) == id).values(**update_dict)
+            .returning(Load).options(*_RETURNING_OPTIONS)
+        )
+        load = session.execute(statement).scalar_one_or_none()
+    else:
+        load = session.get(Load, id, options=_RETURNING_OPTIONS)
     if not load:
         raise HTTPException(status_code=404, detail="Load not found")
-    
-    update_dict = load_in.model_dump(exclude_unset=True)
-    load.sqlmodel_update(update_dict)
-    session.add(load)
+    # Serialize before the commit expires the row, which would cost a reload SELECT
+    public = LoadPublic.model_validate(load)
     session.commit()
-    session.refresh(load)
-    return load
+    return public
 
 
 @router.delete("/{id}")
@@ -81,10 +113,14 @@ def delete_load(
     """
     Delete a load.
     """
-    load = session.get(Load, id)
-    if not load:
+    # Jumps cascade with their load, as the ORM delete used to
+    session.execute(delete(Jump).where(col(Jump.load_id) == id))
+    deleted_id = session.execute(
+        delete(Load).where(col(Load.id) == id).returning(col(Load.id))
+    ).scalar_one_or_none()
+    if not deleted_id:
+        session.rollback()
         raise HTTPException(status_code=404, detail="Load not found")
-    session.delete(load)
     session.commit()
     return Message(message="Load deleted successfully")
 
@@ -96,9 +132,8 @@ def read_loads_by_status(
     """
     Retrieve loads by status.
     """
-    statement = select(Load).where(Load.status == status).offset(skip).limit(limit)
-    loads = session.exec(statement).all()
-    count = len(loads)
+    statement = select(Load).options(*_LIST_OPTIONS).where(Load.status == status)
+    loads, count = crud.get_page(session=session, statement=statement, skip=skip, limit=limit)
     return LoadsPublic(data=loads, count=count)
 
 
@@ -109,10 +144,12 @@ def read_todays_loads(
     """
     Retrieve today's loads.
     """
-    today = datetime.now().date()
-    statement = select(Load).where(func.date(Load.scheduled_time) == today).offset(skip).limit(limit)
-    loads = session.exec(statement).all()
-    count = len(loads)
+    today_start = datetime.combine(datetime.now().date(), time.min)
+    statement = select(Load).options(*_LIST_OPTIONS).where(
+        Load.scheduled_time >= today_start,
+        Load.scheduled_time < today_start + timedelta(days=1)
+    )
+    loads, count = crud.get_page(session=session, statement=statement, skip=skip, limit=limit)
     return LoadsPublic(data=loads, count=count)
 
 
@@ -130,6 +167,20 @@ def add_jumper_to_load(
         raise HTTPException(status_code=400, detail=str(e))
 
 
+@router.post("/{id}/add-jumpers")
+def add_jumpers_to_load(
+    session: SessionDep, current_user: CurrentUser, id: uuid.UUID, jumper_ids: list[uuid.UUID]
+) -> Message:
+    """
+    Add several jumpers to a load in one transaction.
+    """
+    try:
+        added = crud.add_jumpers_to_load(session=session, load_id=id, jumper_ids=jumper_ids)
+        return Message(message=f"{added} jumpers added to load successfully")
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
 @router.delete("/{id}/remove-jumper/{jumper_id}")
 def remove_jumper_from_load(
     session: SessionDep, current_user: CurrentUser, id: uuid.UUID, jumper_id: uuid.UUID
@@ -1,7 +1,11 @@
+from typing import Any
+
 from fastapi import APIRouter, Depends
 from pydantic.networks import EmailStr
+from sqlalchemy.pool import QueuePool
 
 from app.api.deps import get_current_active_superuser
+from app.core.db import engine
 from app.models import Message
 from app.utils import generate_test_email, send_email
 
@@ -29,3 +33,23 @@ def test_email(email_to: EmailStr) -> Message:
 @router.get("/health-check/")
 async def health_check() -> bool:
     return True
+
+
+@router.get(
+    "/health-check/pool/",
+    dependencies=[Depends(get_current_active_superuser)],
+)
+def pool_health_check() -> dict[str, Any]:
+    """
+    Report this worker's database connection pool usage.
+    """
+    pool = engine.pool
+    if not isinstance(pool, QueuePool):
+        return {"status": pool.status()}
+    return {
+        "size": pool.size(),
+        "checked_in": pool.checkedin(),
+        "checked_out": pool.checkedout(),
+        "overflow": pool.overflow(),
+        "status": pool.status(),
+    }
@@ -1,32 +1,67 @@
 from typing import Any
 import uuid
-from datetime import datetime, date
+from datetime import datetime, date, time, timedelta
 
-from fastapi import APIRouter, HTTPException
-from sqlmodel import func, select
+from fastapi import APIRouter, HTTPException, Request, Response
+from fastapi.responses import ORJSONResponse
+from sqlmodel import Session, col, select, update
 
 from app.api.deps import CurrentUser, SessionDep
+from app.core.cache import cached
+from app.core.config import settings
+from app.core.etag import body_etag, etag_matches
 from app.models import WeatherReport, WeatherReportCreate, WeatherReportPublic, WeatherReportUpdate, WeatherReportsPublic, Message
 from app import crud
 
 router = APIRouter()
 
+# List routes select plain columns: rows skip ORM hydration and the identity map
+_REPORT_COLUMNS = tuple(getattr(WeatherReport, name) for name in WeatherReportPublic.model_fields)
+
+
+def _reports_response(reports: list[Any], count: int | None, next_cursor: str | None = None) -> ORJSONResponse:
+    """Serialize a page of database rows without validating each one again.
+
+    Returning a response directly skips FastAPI's response_model validation,
+    which the route decorators keep declaring for the OpenAPI schema. orjson
+    encodes the datetime, UUID and enum values itself, so the rows go
+    straight to bytes without passing through Pydantic at all.
+    """
+    fields = WeatherReportPublic.model_fields
+    return ORJSONResponse({
+        "data": [{name: getattr(report, name) for name in fields} for report in reports],
+        "count": count,
+        "next_cursor": next_cursor,
+    })
+
 
 @router.get("/", response_model=WeatherReportsPublic)
 def read_weather_reports(
-    session: SessionDep, current_user: CurrentUser, skip: int = 0, limit: int = 100
+    session: SessionDep,
+    current_user: CurrentUser,
+    skip: int = 0,
+    limit: int = 100,
+    cursor: str | None = None,
 ) -> Any:
     """
-    Retrieve weather reports.
+    Retrieve weather reports, newest first. Pass the returned next_cursor to get the following page; cursor pages come without a count.
     """
 
-    count_statement = select(func.count()).select_from(WeatherReport)
-    count = session.exec(count_statement).one()
-
-    statement = select(WeatherReport).offset(skip).limit(limit)
-    reports = session.exec(statement).all()
+    statement = select(*_REPORT_COLUMNS)
+    try:
+        reports, count, next_cursor = crud.get_cursor_page(
+            session=session,
+            statement=statement,
+            order_by=(WeatherReport.date, WeatherReport.id),
+            cursor=cursor,
+            skip=skip,
+            limit=limit,
+            descending=True,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
-    return WeatherReportsPublic(data=reports, count=count)
+    return _reports_response(reports, count, next_cursor)
 
 
 @router.get("/{id}", response_model=WeatherReportPublic)
@@ -47,7 +82,7 @@ def create_weather_report(
     """
     Create new weather report.
     """
-    weather = crud.create_weather_report(session=session, weather_create=weather_in)
+    weather = crud.create_weather_report(session=session, weather_in=weather_in)
     return weather
 
 
@@ -62,16 +97,19 @@ def update_weather_report(
     """
     Update a weather report.
     """
-    report = session.get(WeatherReport, id)
+    update_dict = weather_in.model_dump(exclude_unset=True)
+    if update_dict:
+        # UPDATE ... RETURNING finds, changes and returns the row in one statement
+        statement = update(WeatherReport).where(col(WeatherReport.id) == id).values(**update_dict).returning(WeatherReport)
+        report = session.execute(statement).scalar_one_or_none()
+    else:
+        report = session.get(WeatherReport, id)
     if not report:
         raise HTTPException(status_code=404, detail="Weather report not found")
-    
-    update_dict = weather_in.model_dump(exclude_unset=True)
-    report.sqlmodel_update(update_dict)
-    session.add(report)
+    # Serialize before the commit expires the row, which would cost a reload SELECT
+    public = WeatherReportPublic.model_validate(report)
     session.commit()
-    session.refresh(report)
-    return report
+    return public
 
 
 @router.delete("/{id}")
@@ -89,15 +127,31 @@ def delete_weather_report(
     return Message(message="Weather report deleted successfully")
 
 
+@cached("weather", ttl=settings.WEATHER_CACHE_TTL_SECONDS)
+def _latest_report(*, session: Session) -> tuple[WeatherReportPublic, str] | None:
+    report = crud.get_latest_weather_report(session=session)
+    if not report:
+        return None
+    # Keep a detached copy, tagged once here rather than hashed per request
+    public = WeatherReportPublic.model_validate(report)
+    return public, body_etag(public.model_dump_json().encode())
+
+
 @router.get("/current/", response_model=WeatherReportPublic)
-def read_current_weather(session: SessionDep, current_user: CurrentUser) -> Any:
+def read_current_weather(
+    session: SessionDep, current_user: CurrentUser, request: Request, response: Response
+) -> Any:
     """
     Get the most recent weather report.
     """
-    statement = select(WeatherReport).order_by(WeatherReport.date.desc()).limit(1)
-    report = session.exec(statement).first()
-    if not report:
+    latest = _latest_report(session=session)
+    if not latest:
         raise HTTPException(status_code=404, detail="No weather reports found")
+    report, etag = latest
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and etag_matches(etag, if_none_match):
+        return Response(status_code=304, headers={"ETag": etag})
+    response.headers["ETag"] = etag
     return report
 
 
@@ -108,13 +162,14 @@ def read_todays_weather(
     """
     Retrieve today's weather reports.
     """
-    today = datetime.now().date()
-    statement = select(WeatherReport).where(
-        func.date(WeatherReport.date) == today
-    ).order_by(WeatherReport.date.desc()).offset(skip).limit(limit)
-    reports = session.exec(statement).all()
-    count = len(reports)
-    return WeatherReportsPublic(data=reports, count=count)
+    # A half-open range on the raw column keeps the date index usable
+    day_start = datetime.combine(datetime.now().date(), time.min)
+    statement = select(*_REPORT_COLUMNS).where(
+        WeatherReport.date >= day_start,
+        WeatherReport.date < day_start + timedelta(days=1)
+    ).order_by(col(WeatherReport.date).desc())
+    reports, count = crud.get_page(session=session, statement=statement, skip=skip, limit=limit)
+    return _reports_response(reports, count)
 
 
 @router.get("/suitable-for-jumping/", response_model=WeatherReportsPublic)
@@ -124,14 +179,13 @@ def read_suitable_weather(
     """
     Retrieve weather reports suitable for jumping.
     """
-    statement = select(WeatherReport).where(
+    statement = select(*_REPORT_COLUMNS).where(
         WeatherReport.suitable_for_tandems == True,
         WeatherReport.suitable_for_students == True,
         WeatherReport.suitable_for_fun_jumpers == True
-    ).order_by(WeatherReport.date.desc()).offset(skip).limit(limit)
-    reports = session.exec(statement).all()
-    count = len(reports)
-    return WeatherReportsPublic(data=reports, count=count)
+    ).order_by(col(WeatherReport.date).desc())
+    reports, count = crud.get_page(session=session, statement=statement, skip=skip, limit=limit)
+    return _reports_response(reports, count)
 
 
 @router.get("/tandem-suitable/", response_model=WeatherReportsPublic)
@@ -141,12 +195,11 @@ def read_tandem_suitable_weather(
     """
     Retrieve weather reports suitable for tandem jumps.
     """
-    statement = select(WeatherReport).where(
+    statement = select(*_REPORT_COLUMNS).where(
         WeatherReport.suitable_for_tandems == True
-    ).order_by(WeatherReport.date.desc()).offset(skip).limit(limit)
-    reports = session.exec(statement).all()
-    count = len(reports)
-    return WeatherReportsPublic(data=reports, count=count)
+    ).order_by(col(WeatherReport.date).desc())
+    reports, count = crud.get_page(session=session, statement=statement, skip=skip, limit=limit)
+    return _reports_response(reports, count)
 
 
 @router.get("/student-suitable/", response_model=WeatherReportsPublic)
@@ -156,9 +209,8 @@ def read_student_suitable_weather(
     """
     Retrieve weather reports suitable for student jumps.
     """
-    statement = select(WeatherReport).where(
+    statement = select(*_REPORT_COLUMNS).where(
         WeatherReport.suitable_for_students == True
-    ).order_by(WeatherReport.date.desc()).offset(skip).limit(limit)
-    reports = session.exec(statement).all()
-    count = len(reports)
-    return WeatherReportsPublic(data=reports, count=count)
+    ).order_by(col(WeatherReport.date).desc())
+    reports, count = crud.get_page(session=session, statement=statement, skip=skip, limit=limit)
+    return _reports_response(reports, count)
@@ -0,0 +1,91 @@
+import functools
+import threading
+import time
+from collections.abc import Callable, Hashable
+from typing import Any, TypeVar
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+# Dependencies FastAPI injects that never change what an endpoint returns
+IGNORED_PARAMS = frozenset({"session", "current_user"})
+
+
+class TTLCache:
+    """Process-local cache of values that expire after a per-entry TTL.
+
+    Entries are grouped into namespaces so that a write can drop every
+    cached result that depends on it. Each worker process keeps its own
+    cache, so TTLs should stay short enough that staleness between workers
+    is harmless.
+    """
+
+    def __init__(self, maxsize: int = 1024) -> None:
+        self.maxsize = maxsize
+        self._entries: dict[tuple[str, Hashable], tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, namespace: str, key: Hashable) -> Any | None:
+        with self._lock:
+            entry = self._entries.get((namespace, key))
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[(namespace, key)]
+                return None
+            return value
+
+    def set(self, namespace: str, key: Hashable, value: Any, ttl: float) -> None:
+        with self._lock:
+            if len(self._entries) >= self.maxsize:
+                self._evict()
+            self._entries[(namespace, key)] = (time.monotonic() + ttl, value)
+
+    def clear(self, namespace: str) -> None:
+        with self._lock:
+            for entry_key in [k for k in self._entries if k[0] == namespace]:
+                del self._entries[entry_key]
+
+    def _evict(self) -> None:
+        now = time.monotonic()
+        for entry_key in [
+            k for k, (expires_at, _) in self._entries.items() if expires_at <= now
+        ]:
+            del self._entries[entry_key]
+        if len(self._entries) >= self.maxsize:
+            # Still full: drop the oldest insertion
+            del self._entries[next(iter(self._entries))]
+
+
+cache = TTLCache()
+
+
+def cached(namespace: str, ttl: float) -> Callable[[F], F]:
+    """Cache an endpoint's return value, keyed by its request parameters."""
+
+    def decorator(func: F) -> F:
+        # Fully qualified, so a crud helper and a route sharing a name and
+        # a namespace never read each other's results
+        name = f"{func.__module__}.{func.__qualname__}"
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            # The key is built from keyword arguments only (FastAPI passes
+            # every parameter by name); positional ones would share a result
+            if args:
+                raise TypeError(
+                    f"{func.__qualname__}() must be called with keyword arguments when cached"
+                )
+            key = (
+                name,
+                *sorted((k, v) for k, v in kwargs.items() if k not in IGNORED_PARAMS),
+            )
+            value = cache.get(namespace, key)
+            if value is None:
+                value = func(*args, **kwargs)
+                cache.set(namespace, key, value, ttl)
+            return value
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
@@ -37,6 +37,8 @@ class Settings(BaseSettings):
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 60 * 24 * 8
     FRONTEND_HOST: str = "http://localhost:5173"
     ENVIRONMENT: Literal["local", "staging", "production"] = "local"
+    ANALYTICS_CACHE_TTL_SECONDS: int = 60
+    WEATHER_CACHE_TTL_SECONDS: int = 60
 
     BACKEND_CORS_ORIGINS: Annotated[
         list[AnyUrl] | str, BeforeValidator(parse_cors)
@@ -56,6 +58,19 @@ class Settings(BaseSettings):
     POSTGRES_USER: str
     POSTGRES_PASSWORD: str = ""
     POSTGRES_DB: str = ""
+    # Connections are per worker process: the default 4 workers * (10 + 10)
+    # stays under Postgres' default max_connections of 100, leaving headroom
+    # for prestart, migrations and admin sessions. Size the pool to the
+    # worker threads (AnyIO's default 40 run sync path operations), never the
+    # other way round: a request holds its connection while it waits for the
+    # next thread, so capping threads at the pool size can deadlock. Threads
+    # beyond pool + overflow just wait in checkout, up to pool_timeout
+    POSTGRES_POOL_SIZE: int = 10
+    POSTGRES_MAX_OVERFLOW: int = 10
+    POSTGRES_POOL_RECYCLE_SECONDS: int = 1800
+    # Compiled SQL cached per engine; filter combinations across the list
+    # routes add up to more distinct statements than SQLAlchemy's default 500
+    POSTGRES_QUERY_CACHE_SIZE: int = 1200
 
     @computed_field  # type: ignore[prop-decorator]
     @property
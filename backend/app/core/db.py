@@ -1,10 +1,28 @@
-from sqlmodel import Session, create_engine, select
+from sqlmodel import Session, create_engine, select, text
 
 from app import crud
+from app.core.cache import cache
 from app.core.config import settings
 from app.models import User, UserCreate
 
-engine = create_engine(str(settings.SQLALCHEMY_DATABASE_URI))
+engine = create_engine(
+    str(settings.SQLALCHEMY_DATABASE_URI),
+    pool_size=settings.POSTGRES_POOL_SIZE,
+    max_overflow=settings.POSTGRES_MAX_OVERFLOW,
+    pool_pre_ping=True,
+    pool_recycle=settings.POSTGRES_POOL_RECYCLE_SECONDS,
+    query_cache_size=settings.POSTGRES_QUERY_CACHE_SIZE,
+)
+
+
+def refresh_jump_views() -> None:
+    """Rebuild the jump materialized views without blocking their readers."""
+    with Session(engine) as session:
+        session.execute(text("REFRESH MATERIALIZED VIEW CONCURRENTLY jump_type_daily"))
+        session.execute(text("REFRESH MATERIALIZED VIEW CONCURRENTLY load_stats"))
+        session.commit()
+    # Results cached while the refresh ran were read from the old views
+    cache.clear("analytics")
 
 
 # make sure all SQLModel models are imported (app.models) before initializing DB
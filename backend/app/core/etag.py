@@ -0,0 +1,89 @@
+import hashlib
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+
+def body_etag(body: bytes) -> str:
+    return f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+
+
+def etag_matches(etag: str, if_none_match: str) -> bool:
+    candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return "*" in candidates or etag in candidates
+
+
+class ETagMiddleware:
+    """Tag successful GET responses with a body hash and answer repeats with 304.
+
+    The tag is derived from the response body itself, so it stays correct
+    across worker processes without any shared version counter. The
+    endpoint still runs, but a polling client that already has the payload
+    skips the transfer and its own parsing. Only complete JSON bodies are
+    buffered: streamed responses (no Content-Length), HTML docs and
+    responses whose endpoint already set an ETag pass through untouched.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] != "GET":
+            await self.app(scope, receive, send)
+            return
+
+        if_none_match = Headers(scope=scope).get("if-none-match")
+        start_message: Message | None = None
+        passthrough = False
+        body = bytearray()
+
+        async def send_with_etag(message: Message) -> None:
+            nonlocal start_message, passthrough
+            if message["type"] == "http.response.start":
+                headers = Headers(raw=message["headers"])
+                if (
+                    message["status"] != 200
+                    or "etag" in headers
+                    or "content-length" not in headers
+                    or not headers.get("content-type", "").startswith(
+                        "application/json"
+                    )
+                ):
+                    passthrough = True
+                    await send(message)
+                else:
+                    start_message = message
+                return
+            if passthrough or message["type"] != "http.response.body":
+                await send(message)
+                return
+
+            body.extend(message.get("body", b""))
+            if message.get("more_body", False):
+                return
+
+            assert start_message is not None
+            etag = body_etag(bytes(body))
+            if if_none_match and etag_matches(etag, if_none_match):
+                # A 304 must repeat the caching headers the 200 would have sent
+                not_modified = MutableHeaders(raw=[(b"etag", etag.encode())])
+                original = Headers(raw=start_message["headers"])
+                for name in ("cache-control", "vary"):
+                    if name in original:
+                        not_modified[name] = original[name]
+                await send(
+                    {
+                        "type": "http.response.start",
+                        "status": 304,
+                        "headers": not_modified.raw,
+                    }
+                )
+                await send({"type": "http.response.body", "body": b""})
+                return
+
+            headers = MutableHeaders(raw=start_message["headers"])
+            headers["ETag"] = etag
+            await send(start_message)
+            await send({"type": "http.response.body", "body": bytes(body)})
+
+        await self.app(scope, receive, send_with_etag)
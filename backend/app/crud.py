@@ -1,19 +1,29 @@
+import base64
+import json
 import uuid
-from typing import Any
+from collections.abc import Sequence
+from typing import Any, TypeVar
 from datetime import datetime
 
-from sqlmodel import Session, select, and_
+from sqlalchemy import bindparam
+from sqlmodel import Session, and_, col, func, insert, select, tuple_, update
+from sqlmodel.sql.expression import Select, SelectOfScalar
 
+from app.core.cache import cached
+from app.core.config import settings
 from app.core.security import get_password_hash, verify_password
 from app.models import (
     Item, ItemCreate, User, UserCreate, UserUpdate,
-    Aircraft, AircraftCreate, AircraftUpdate,
-    Instructor, InstructorCreate, InstructorUpdate,
-    Load, LoadCreate, LoadUpdate, LoadStatus,
-    Jump, JumpCreate, JumpUpdate, JumpType,
-    WeatherReport, WeatherReportCreate, WeatherReportUpdate
+    Aircraft, AircraftCreate, AircraftPublic,
+    Instructor, InstructorCreate,
+    Load, LoadCreate, LoadStatus,
+    Jump, JumpCreate, JumpType,
+    WeatherReport, WeatherReportCreate, WeatherReportUpdate,
+    load_stats,
 )
 
+T = TypeVar("T")
+
 
 def create_user(*, session: Session, user_create: UserCreate) -> User:
     db_obj = User.model_validate(
@@ -62,6 +72,82 @@ def create_item(*, session: Session, item_in: ItemCreate, owner_id: uuid.UUID) -
     return db_item
 
 
+# Pagination
+def _page_items(statement: SelectOfScalar[T] | Select[T], rows: list[Any]) -> list[T]:
+    # Entity selects yield the entity; column selects hand back the fetched
+    # list itself, whose trailing total column is harmless to attribute access by name
+    if isinstance(statement, SelectOfScalar):
+        return [row[0] for row in rows]
+    return rows
+
+
+def get_page(
+    *, session: Session, statement: SelectOfScalar[T] | Select[T], skip: int, limit: int
+) -> tuple[list[T], int]:
+    """Get one page of a select along with the total number of matching rows.
+
+    The total is a COUNT(*) OVER() window column on the same query, so the
+    page and the count cost a single round-trip.
+    """
+    paged = statement.add_columns(func.count().over().label("total")).offset(skip).limit(limit)
+    rows = list(session.execute(paged))
+    count = rows[0].total if rows else 0
+    return _page_items(statement, rows), count
+
+
+def _encode_cursor(values: tuple[Any, ...]) -> str:
+    keys = [value.isoformat() if isinstance(value, datetime) else str(value) for value in values]
+    return base64.urlsafe_b64encode(json.dumps(keys).encode()).decode()
+
+
+def _decode_cursor(cursor: str, columns: tuple[Any, ...]) -> tuple[Any, ...]:
+    try:
+        keys = json.loads(base64.urlsafe_b64decode(cursor))
+        if not isinstance(keys, list) or len(keys) != len(columns):
+            raise ValueError
+        if not all(isinstance(key, str) for key in keys):
+            raise ValueError
+        return tuple(
+            datetime.fromisoformat(key) if column.type.python_type is datetime else column.type.python_type(key)
+            for key, column in zip(keys, columns, strict=True)
+        )
+    except (ValueError, TypeError):
+        raise ValueError("Invalid cursor")
+
+
+def get_cursor_page(
+    *,
+    session: Session,
+    statement: SelectOfScalar[T] | Select[T],
+    order_by: tuple[Any, ...],
+    cursor: str | None,
+    skip: int,
+    limit: int,
+    descending: bool = False,
+) -> tuple[list[T], int | None, str | None]:
+    """Get one page of a select ordered by a unique key, plus a cursor to the next.
+
+    With a cursor the page starts right after the row it encodes, a
+    row-value comparison an index on the ``order_by`` columns can seek to,
+    so deep pages cost no more than the first. Counting every row would
+    undo that, so cursor pages come back without a total (``None``).
+    Without a cursor it falls back to ``skip`` and counts as ``get_page`` does.
+    """
+    ordered = statement.order_by(*(column.desc() if descending else column for column in order_by))
+    count: int | None
+    if cursor is None:
+        items, count = get_page(session=session, statement=ordered, skip=skip, limit=limit)
+    else:
+        after = _decode_cursor(cursor, order_by)
+        position = tuple_(*order_by) < tuple_(*after) if descending else tuple_(*order_by) > tuple_(*after)
+        items = list(session.exec(ordered.where(position).limit(limit)).all())
+        count = None
+    next_cursor = None
+    if items and len(items) == limit:
+        next_cursor = _encode_cursor(tuple(getattr(items[-1], column.key) for column in order_by))
+    return items, count, next_cursor
+
+
 # Aircraft CRUD operations
 def create_aircraft(*, session: Session, aircraft_in: AircraftCreate) -> Aircraft:
     db_aircraft = Aircraft.model_validate(aircraft_in)
@@ -75,18 +161,12 @@ def get_aircraft(*, session: Session, aircraft_id: uuid.UUID) -> Aircraft | None
     return session.get(Aircraft, aircraft_id)
 
 
-def get_aircrafts(*, session: Session, skip: int = 0, limit: int = 100) -> list[Aircraft]:
-    statement = select(Aircraft).where(Aircraft.is_active == True).offset(skip).limit(limit)
-    return list(session.exec(statement).all())
-
-
-def update_aircraft(*, session: Session, db_aircraft: Aircraft, aircraft_in: AircraftUpdate) -> Aircraft:
-    aircraft_data = aircraft_in.model_dump(exclude_unset=True)
-    db_aircraft.sqlmodel_update(aircraft_data)
-    session.add(db_aircraft)
-    session.commit()
-    session.refresh(db_aircraft)
-    return db_aircraft
+def get_aircrafts(*, session: Session, skip: int = 0, limit: int = 100) -> list[dict[str, Any]]:
+    # Plain column rows skip ORM identity tracking; they come straight from
+    # the table, so their mappings are already the public fields
+    columns = [getattr(Aircraft, name) for name in AircraftPublic.model_fields]
+    statement = select(*columns).where(Aircraft.is_active == True).offset(skip).limit(limit)
+    return [dict(row._mapping) for row in session.execute(statement)]
 
 
 # Instructor CRUD operations
@@ -102,26 +182,29 @@ def get_instructor(*, session: Session, instructor_id: uuid.UUID) -> Instructor
     return session.get(Instructor, instructor_id)
 
 
-def get_instructors(*, session: Session, skip: int = 0, limit: int = 100, 
-                   tandem_only: bool = False, aff_only: bool = False) -> list[Instructor]:
-    statement = select(Instructor).where(Instructor.is_active == True)
-    
-    if tandem_only:
-        statement = statement.where(Instructor.tandem_certified == True)
-    if aff_only:
-        statement = statement.where(Instructor.aff_certified == True)
-    
-    statement = statement.offset(skip).limit(limit)
-    return list(session.exec(statement).all())
+def _active_instructors(*criteria: Any) -> SelectOfScalar[Instructor]:
+    # Ordered like the partial indexes on (name, id), so pages read straight off them
+    return select(Instructor).where(col(Instructor.is_active), *criteria).order_by(col(Instructor.name), col(Instructor.id))
 
 
-def update_instructor(*, session: Session, db_instructor: Instructor, instructor_in: InstructorUpdate) -> Instructor:
-    instructor_data = instructor_in.model_dump(exclude_unset=True)
-    db_instructor.sqlmodel_update(instructor_data)
-    session.add(db_instructor)
-    session.commit()
-    session.refresh(db_instructor)
-    return db_instructor
+# Built once per (tandem_only, aff_only) filter combination
+_ACTIVE_INSTRUCTOR_STATEMENTS = {
+    (False, False): _active_instructors(),
+    (True, False): _active_instructors(col(Instructor.tandem_certified)),
+    (False, True): _active_instructors(col(Instructor.aff_certified)),
+    (True, True): _active_instructors(col(Instructor.tandem_certified), col(Instructor.aff_certified)),
+}
+
+
+def active_instructors_statement(*, tandem_only: bool = False, aff_only: bool = False) -> SelectOfScalar[Instructor]:
+    return _ACTIVE_INSTRUCTOR_STATEMENTS[(tandem_only, aff_only)]
+
+
+def get_instructors(*, session: Session, skip: int = 0, limit: int = 100, 
+                   tandem_only: bool = False, aff_only: bool = False) -> Sequence[Instructor]:
+    statement = active_instructors_statement(tandem_only=tandem_only, aff_only=aff_only)
+    statement = statement.offset(skip).limit(limit)
+    return session.exec(statement).all()
 
 
 # Load CRUD operations
@@ -137,47 +220,63 @@ def get_load(*, session: Session, load_id: uuid.UUID) -> Load | None:
     return session.get(Load, load_id)
 
 
-def get_loads(*, session: Session, skip: int = 0, limit: int = 100, 
-              date_filter: datetime | None = None, status: LoadStatus | None = None) -> list[Load]:
-    statement = select(Load)
+def add_jumpers_to_load(*, session: Session, load_id: uuid.UUID, jumper_ids: list[uuid.UUID]) -> int:
+    """Move existing jumps onto a load in a single UPDATE, checking capacity once"""
+    capacity_row = session.exec(
+        select(Aircraft.capacity, func.count(col(Jump.id)))
+        .select_from(Load)
+        .join(Aircraft, col(Aircraft.id) == Load.aircraft_id)
+        .outerjoin(Jump, col(Jump.load_id) == Load.id)
+        .where(Load.id == load_id)
+        .group_by(col(Aircraft.capacity))
+    ).first()
+    if not capacity_row:
+        raise ValueError("Load not found")
+    capacity, current_jumpers = capacity_row
     
-    if date_filter:
-        statement = statement.where(Load.scheduled_time >= date_filter)
-    if status:
-        statement = statement.where(Load.status == status)
+    requested_ids = set(jumper_ids)
+    jumpers = session.exec(select(Jump.id, Jump.load_id).where(col(Jump.id).in_(requested_ids))).all()
+    if len(jumpers) != len(requested_ids):
+        raise ValueError("Jumper not found")
     
-    statement = statement.order_by(Load.scheduled_time).offset(skip).limit(limit)
-    return list(session.exec(statement).all())
-
+    incoming = sum(1 for _, current_load_id in jumpers if current_load_id != load_id)
+    if current_jumpers + incoming > capacity:
+        raise ValueError("Load does not have enough capacity")
 
-def update_load(*, session: Session, db_load: Load, load_in: LoadUpdate) -> Load:
-    load_data = load_in.model_dump(exclude_unset=True)
-    db_load.sqlmodel_update(load_data)
-    session.add(db_load)
+    session.execute(update(Jump).where(col(Jump.id).in_(requested_ids)).values(load_id=load_id))
     session.commit()
-    session.refresh(db_load)
-    return db_load
+    return incoming
 
 
-def get_available_load_capacity(*, session: Session, load_id: uuid.UUID) -> int:
-    """Get remaining capacity for a load"""
-    load = session.get(Load, load_id)
-    if not load:
-        return 0
-    
-    current_jumpers = len(load.jumps)
-    return load.aircraft.capacity - current_jumpers
+def add_jumper_to_load(*, session: Session, load_id: uuid.UUID, jumper_id: uuid.UUID) -> int:
+    return add_jumpers_to_load(session=session, load_id=load_id, jumper_ids=[jumper_id])
 
 
 # Jump CRUD operations
 def create_jump(*, session: Session, jump_in: JumpCreate) -> Jump:
+    # Load, remaining capacity and the instructor's certifications in one round-trip
+    current_jumpers = (
+        select(func.count()).select_from(Jump).where(Jump.load_id == jump_in.load_id).scalar_subquery()
+    )
+    statement = (
+        select(
+            Aircraft.capacity - current_jumpers,
+            Instructor.id,
+            Instructor.tandem_certified,
+            Instructor.aff_certified,
+        )
+        .select_from(Load)
+        .join(Aircraft, col(Aircraft.id) == Load.aircraft_id)
+        .outerjoin(Instructor, col(Instructor.id) == jump_in.instructor_id)
+        .where(Load.id == jump_in.load_id)
+    )
+    row = session.exec(statement).first()
+
     # Validate load capacity
-    load = session.get(Load, jump_in.load_id)
-    if not load:
+    if not row:
         raise ValueError("Load not found")
-    
-    current_capacity = get_available_load_capacity(session=session, load_id=jump_in.load_id)
-    if current_capacity <= 0:
+    available, instructor_id, tandem_certified, aff_certified = row
+    if available <= 0:
         raise ValueError("Load is at full capacity")
     
     # Validate instructor assignment for tandems and AFF
@@ -185,14 +284,13 @@ def create_jump(*, session: Session, jump_in: JumpCreate) -> Jump:
         if not jump_in.instructor_id:
             raise ValueError(f"{jump_in.jump_type.value} jumps require an instructor")
         
-        instructor = session.get(Instructor, jump_in.instructor_id)
-        if not instructor:
+        if not instructor_id:
             raise ValueError("Instructor not found")
         
-        if jump_in.jump_type == JumpType.TANDEM and not instructor.tandem_certified:
+        if jump_in.jump_type == JumpType.TANDEM and not tandem_certified:
             raise ValueError("Instructor not certified for tandem jumps")
         
-        if jump_in.jump_type == JumpType.AFF and not instructor.aff_certified:
+        if jump_in.jump_type == JumpType.AFF and not aff_certified:
             raise ValueError("Instructor not certified for AFF jumps")
     
     db_jump = Jump.model_validate(jump_in)
@@ -202,12 +300,64 @@ def create_jump(*, session: Session, jump_in: JumpCreate) -> Jump:
     return db_jump
 
 
+def create_jumps(*, session: Session, jumps_in: list[JumpCreate]) -> int:
+    """Validate and insert a batch of jumps with a single multi-row INSERT"""
+    if not jumps_in:
+        return 0
+
+    load_ids = {jump_in.load_id for jump_in in jumps_in}
+    instructor_ids = {jump_in.instructor_id for jump_in in jumps_in if jump_in.instructor_id}
+
+    # Remaining capacity for every referenced load in one query
+    capacity_rows = session.exec(
+        select(Load.id, Aircraft.capacity - func.count(col(Jump.id)))
+        .join(Aircraft, col(Aircraft.id) == Load.aircraft_id)
+        .outerjoin(Jump, col(Jump.load_id) == Load.id)
+        .where(col(Load.id).in_(load_ids))
+        .group_by(col(Load.id), col(Aircraft.capacity))
+    ).all()
+    available = dict(capacity_rows)
+    if len(available) != len(load_ids):
+        raise ValueError("Load not found")
+    for jump_in in jumps_in:
+        available[jump_in.load_id] -= 1
+    if any(remaining < 0 for remaining in available.values()):
+        raise ValueError("Load is at full capacity")
+
+    # Validate instructor assignment for tandems and AFF
+    instructors = {
+        instructor.id: instructor
+        for instructor in session.exec(select(Instructor).where(col(Instructor.id).in_(instructor_ids))).all()
+    }
+    for jump_in in jumps_in:
+        if jump_in.jump_type not in [JumpType.TANDEM, JumpType.AFF]:
+            continue
+        if not jump_in.instructor_id:
+            raise ValueError(f"{jump_in.jump_type.value} jumps require an instructor")
+
+        instructor = instructors.get(jump_in.instructor_id)
+        if not instructor:
+            raise ValueError("Instructor not found")
+
+        if jump_in.jump_type == JumpType.TANDEM and not instructor.tandem_certified:
+            raise ValueError("Instructor not certified for tandem jumps")
+
+        if jump_in.jump_type == JumpType.AFF and not instructor.aff_certified:
+            raise ValueError("Instructor not certified for AFF jumps")
+
+    # model_validate fills in the id and created_at defaults a Core insert would skip
+    rows = [Jump.model_validate(jump_in).model_dump() for jump_in in jumps_in]
+    session.execute(insert(Jump), rows)
+    session.commit()
+    return len(rows)
+
+
 def get_jump(*, session: Session, jump_id: uuid.UUID) -> Jump | None:
     return session.get(Jump, jump_id)
 
 
 def get_jumps(*, session: Session, skip: int = 0, limit: int = 100,
-              load_id: uuid.UUID | None = None, jump_type: JumpType | None = None) -> list[Jump]:
+              load_id: uuid.UUID | None = None, jump_type: JumpType | None = None) -> Sequence[Jump]:
     statement = select(Jump)
     
     if load_id:
@@ -216,30 +366,19 @@ def get_jumps(*, session: Session, skip: int = 0, limit: int = 100,
         statement = statement.where(Jump.jump_type == jump_type)
     
     statement = statement.order_by(Jump.exit_order).offset(skip).limit(limit)
-    return list(session.exec(statement).all())
+    return session.exec(statement).all()
 
 
-def update_jump(*, session: Session, db_jump: Jump, jump_in: JumpUpdate) -> Jump:
-    jump_data = jump_in.model_dump(exclude_unset=True)
-    
-    # Validate instructor change if needed
-    if "instructor_id" in jump_data or "jump_type" in jump_data:
-        new_instructor_id = jump_data.get("instructor_id", db_jump.instructor_id)
-        new_jump_type = jump_data.get("jump_type", db_jump.jump_type)
-        
-        if new_jump_type in [JumpType.TANDEM, JumpType.AFF] and new_instructor_id:
-            instructor = session.get(Instructor, new_instructor_id)
-            if instructor:
-                if new_jump_type == JumpType.TANDEM and not instructor.tandem_certified:
-                    raise ValueError("Instructor not certified for tandem jumps")
-                if new_jump_type == JumpType.AFF and not instructor.aff_certified:
-                    raise ValueError("Instructor not certified for AFF jumps")
-    
-    db_jump.sqlmodel_update(jump_data)
-    session.add(db_jump)
-    session.commit()
-    session.refresh(db_jump)
-    return db_jump
+def check_jump_instructor(*, session: Session, jump: Jump) -> None:
+    """Validate an updated jump's instructor against its jump type"""
+    if jump.jump_type not in [JumpType.TANDEM, JumpType.AFF] or not jump.instructor_id:
+        return
+    instructor = session.get(Instructor, jump.instructor_id)
+    if instructor:
+        if jump.jump_type == JumpType.TANDEM and not instructor.tandem_certified:
+            raise ValueError("Instructor not certified for tandem jumps")
+        if jump.jump_type == JumpType.AFF and not instructor.aff_certified:
+            raise ValueError("Instructor not certified for AFF jumps")
 
 
 def delete_jump(*, session: Session, jump_id: uuid.UUID) -> bool:
@@ -260,49 +399,59 @@ def create_weather_report(*, session: Session, weather_in: WeatherReportCreate)
     return db_weather
 
 
+# Hot statements are built once at import; the engine caches their compiled SQL
+_LATEST_WEATHER_STATEMENT = select(WeatherReport).order_by(col(WeatherReport.date).desc()).limit(1)
+
+
 def get_latest_weather_report(*, session: Session) -> WeatherReport | None:
-    statement = select(WeatherReport).order_by(WeatherReport.date.desc())
-    return session.exec(statement).first()
+    return session.exec(_LATEST_WEATHER_STATEMENT).first()
 
 
 def get_weather_reports(*, session: Session, skip: int = 0, limit: int = 100,
-                       start_date: datetime | None = None) -> list[WeatherReport]:
+                       start_date: datetime | None = None) -> Sequence[WeatherReport]:
     statement = select(WeatherReport)
     
     if start_date:
         statement = statement.where(WeatherReport.date >= start_date)
     
     statement = statement.order_by(WeatherReport.date.desc()).offset(skip).limit(limit)
-    return list(session.exec(statement).all())
+    return session.exec(statement).all()
 
 
 # Analytics and statistics
-def get_load_statistics(*, session: Session, load_id: uuid.UUID) -> dict:
+# Basic revenue estimate per tandem, AFF and fun jumper (these would be configurable)
+_REVENUE_RATES = (250.0, 350.0, 25.0)
+
+# Capacity and the precomputed jump counts in one indexed lookup. Every
+# jump has one of the three types, so their counts add up to the total
+_LOAD_STATS_STATEMENT = (
+    select(
+        col(Aircraft.capacity),
+        func.coalesce(load_stats.c.tandems, 0),
+        func.coalesce(load_stats.c.affs, 0),
+        func.coalesce(load_stats.c.fun_jumpers, 0),
+    )
+    .select_from(Load)
+    .join(Aircraft, col(Aircraft.id) == Load.aircraft_id)
+    .outerjoin(load_stats, load_stats.c.load_id == Load.id)
+    .where(Load.id == bindparam("load_id"))
+)
+
+
+# Cached per load_id; the loads, jumps and aircraft routers clear it on writes
+@cached("analytics", ttl=settings.ANALYTICS_CACHE_TTL_SECONDS)
+def get_load_statistics(*, session: Session, load_id: uuid.UUID) -> dict[str, Any] | None:
     """Get statistics for a specific load"""
-    load = session.get(Load, load_id)
-    if not load:
-        return {}
-    
-    jumps = load.jumps
-    total_jumpers = len(jumps)
-    tandem_count = sum(1 for j in jumps if j.jump_type == JumpType.TANDEM)
-    aff_count = sum(1 for j in jumps if j.jump_type == JumpType.AFF)
-    fun_jumper_count = sum(1 for j in jumps if j.jump_type == JumpType.FUN_JUMPER)
-    
-    capacity_utilization = (total_jumpers / load.aircraft.capacity) * 100 if load.aircraft.capacity > 0 else 0
+    row = session.exec(_LOAD_STATS_STATEMENT, params={"load_id": load_id}).first()
+    if row is None:
+        return None
+    capacity, tandem_count, aff_count, fun_jumper_count = row
+    total_jumpers = tandem_count + aff_count + fun_jumper_count
     
-    # Basic revenue estimate (these would be configurable)
-    revenue_rates = {
-        JumpType.TANDEM: 250.0,
-        JumpType.AFF: 350.0,
-        JumpType.FUN_JUMPER: 25.0
-    }
+    capacity_utilization = (total_jumpers / capacity) * 100 if capacity > 0 else 0
     
-    revenue_estimate = (
-        tandem_count * revenue_rates[JumpType.TANDEM] +
-        aff_count * revenue_rates[JumpType.AFF] +
-        fun_jumper_count * revenue_rates[JumpType.FUN_JUMPER]
-    )
+    tandem_rate, aff_rate, fun_jumper_rate = _REVENUE_RATES
+    revenue_estimate = tandem_count * tandem_rate + aff_count * aff_rate + fun_jumper_count * fun_jumper_rate
     
     return {
         "total_jumpers": total_jumpers,
@@ -314,8 +463,51 @@ def get_load_statistics(*, session: Session, load_id: uuid.UUID) -> dict:
     }
 
 
+def get_load_status_statistics(*, session: Session) -> dict[str, int]:
+    """Count loads overall and per status in a single scan"""
+    statement = select(
+        func.count().label("total_loads"),
+        *[func.count().filter(col(Load.status) == status).label(status.value) for status in LoadStatus]
+    )
+    return dict(session.execute(statement).one()._mapping)
+
+
+def _instructor_workload_statement() -> Any:
+    """Per-instructor jump counts, aggregated in a single GROUP BY"""
+    return (
+        select(
+            Instructor.id,
+            func.count(col(Jump.id)),
+            func.count(col(Jump.id)).filter(col(Jump.jump_type) == JumpType.TANDEM),
+            func.count(col(Jump.id)).filter(col(Jump.jump_type) == JumpType.AFF),
+        )
+        .outerjoin(Jump, col(Jump.instructor_id) == Instructor.id)
+        .group_by(col(Instructor.id))
+    )
+
+
+def get_instructor_workload(*, session: Session, instructor_id: uuid.UUID) -> dict[str, int] | None:
+    """Get jump counts for a single instructor"""
+    statement = _instructor_workload_statement().where(Instructor.id == instructor_id)
+    row = session.exec(statement).first()
+    if not row:
+        return None
+
+    _, total_jumps, tandem_jumps, aff_jumps = row
+    return {"total_jumps": total_jumps, "tandem_jumps": tandem_jumps, "aff_jumps": aff_jumps}
+
+
+def get_instructor_workloads(*, session: Session) -> dict[str, dict[str, int]]:
+    """Get jump counts for every instructor, keyed by instructor id"""
+    rows = session.exec(_instructor_workload_statement()).all()
+    return {
+        str(instructor_id): {"total_jumps": total_jumps, "tandem_jumps": tandem_jumps, "aff_jumps": aff_jumps}
+        for instructor_id, total_jumps, tandem_jumps, aff_jumps in rows
+    }
+
+
 def get_instructor_schedule(*, session: Session, instructor_id: uuid.UUID, 
-                           date_filter: datetime | None = None) -> list[Jump]:
+                           date_filter: datetime | None = None) -> Sequence[Jump]:
     """Get an instructor's scheduled jumps"""
     statement = select(Jump).where(Jump.instructor_id == instructor_id)
     
@@ -323,4 +515,4 @@ def get_instructor_schedule(*, session: Session, instructor_id: uuid.UUID,
         # Join with Load to filter by date
         statement = statement.join(Load).where(Load.scheduled_time >= date_filter)
     
-    return list(session.exec(statement).all())
+    return session.exec(statement).all()
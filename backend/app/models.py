@@ -3,6 +3,7 @@ from datetime import datetime
 from enum import Enum
 
 from pydantic import EmailStr
+from sqlalchemy import Index, column, table, text
 from sqlmodel import Field, Relationship, SQLModel
 
 
@@ -205,6 +206,22 @@ class InstructorUpdate(SQLModel):
 
 
 class Instructor(InstructorBase, table=True):
+    # Active instructors by certification, in the order their lists page through
+    __table_args__ = (
+        Index(
+            "ix_instructor_active_tandem_name_id",
+            "name",
+            "id",
+            postgresql_where=text("is_active AND tandem_certified"),
+        ),
+        Index(
+            "ix_instructor_active_aff_name_id",
+            "name",
+            "id",
+            postgresql_where=text("is_active AND aff_certified"),
+        ),
+    )
+
     id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
     jumps: list["Jump"] = Relationship(back_populates="instructor")
 
@@ -220,7 +237,7 @@ class InstructorsPublic(SQLModel):
 
 # Load model (aircraft load)
 class LoadBase(SQLModel):
-    aircraft_id: uuid.UUID = Field(foreign_key="aircraft.id")
+    aircraft_id: uuid.UUID = Field(foreign_key="aircraft.id", index=True)
     scheduled_time: datetime
     altitude: int = Field(ge=3000, le=18000, default=10000)  # feet
     status: LoadStatus = LoadStatus.PLANNING
@@ -240,6 +257,9 @@ class LoadUpdate(SQLModel):
 
 
 class Load(LoadBase, table=True):
+    # Keyset pagination seeks on (scheduled_time, id); date-range filters use it too
+    __table_args__ = (Index("ix_load_scheduled_time_id", "scheduled_time", "id"),)
+
     id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
     created_at: datetime = Field(default_factory=datetime.utcnow)
     aircraft: Aircraft = Relationship(back_populates="loads")
@@ -255,7 +275,9 @@ class LoadPublic(LoadBase):
 
 class LoadsPublic(SQLModel):
     data: list[LoadPublic]
-    count: int
+    # Not counted for pages fetched with a cursor
+    count: int | None
+    next_cursor: str | None = None
 
 
 # Jump model (individual jumper on a load)
@@ -286,6 +308,10 @@ class JumpUpdate(SQLModel):
 
 
 class Jump(JumpBase, table=True):
+    # Jumps of one load in exit order come straight off this index, no sort;
+    # it serves every other lookup by load_id as well
+    __table_args__ = (Index("ix_jump_load_id_exit_order", "load_id", "exit_order"),)
+
     id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
     created_at: datetime = Field(default_factory=datetime.utcnow)
     load: Load = Relationship(back_populates="jumps")
@@ -303,6 +329,27 @@ class JumpsPublic(SQLModel):
     count: int
 
 
+# Materialized views maintained by migrations and refreshed after jump
+# writes; kept out of SQLModel.metadata on purpose
+# Per-day jump counts by type
+jump_type_daily = table(
+    "jump_type_daily",
+    column("day"),
+    column("jump_type", Jump.__table__.c.jump_type.type),  # type: ignore[attr-defined]
+    column("count"),
+)
+
+# Per-load jump counts, overall and by type; loads without jumps have no row
+load_stats = table(
+    "load_stats",
+    column("load_id"),
+    column("total"),
+    column("tandems"),
+    column("affs"),
+    column("fun_jumpers"),
+)
+
+
 # Weather report model
 class WeatherReportBase(SQLModel):
     date: datetime
@@ -333,6 +380,21 @@ class WeatherReportUpdate(SQLModel):
 
 
 class WeatherReport(WeatherReportBase, table=True):
+    # Keyset pagination and date-range filters seek on (date, id), scanned
+    # backwards for newest first.
+    # The partial indexes hold only the rows each suitable-for-* list returns,
+    # already in date order, so those pages need neither a scan nor a sort.
+    __table_args__ = (
+        Index("ix_weatherreport_date_id", "date", "id"),
+        Index(
+            "ix_weatherreport_suitable_all_date",
+            "date",
+            postgresql_where=text("suitable_for_tandems AND suitable_for_students AND suitable_for_fun_jumpers"),
+        ),
+        Index("ix_weatherreport_suitable_tandems_date", "date", postgresql_where=text("suitable_for_tandems")),
+        Index("ix_weatherreport_suitable_students_date", "date", postgresql_where=text("suitable_for_students")),
+    )
+
     id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
     created_at: datetime = Field(default_factory=datetime.utcnow)
 
@@ -344,7 +406,9 @@ class WeatherReportPublic(WeatherReportBase):
 
 class WeatherReportsPublic(SQLModel):
     data: list[WeatherReportPublic]
-    count: int
+    # Not counted for pages fetched with a cursor
+    count: int | None
+    next_cursor: str | None = None
 
 
 # Load summary with statistics
@@ -0,0 +1,34 @@
+from fastapi.testclient import TestClient
+from sqlmodel import Session
+
+from app.core.config import settings
+from app.tests.utils.load import create_random_aircraft
+
+
+def test_read_aircraft(
+    client: TestClient, superuser_token_headers: dict[str, str], db: Session
+) -> None:
+    aircraft = create_random_aircraft(db, capacity=6)
+    retired = create_random_aircraft(db)
+    response = client.put(
+        f"{settings.API_V1_STR}/aircraft/{retired.id}",
+        headers=superuser_token_headers,
+        json={"is_active": False},
+    )
+    assert response.status_code == 200
+
+    response = client.get(
+        f"{settings.API_V1_STR}/aircraft/",
+        headers=superuser_token_headers,
+        params={"limit": 1000},
+    )
+    assert response.status_code == 200
+    content = {row["id"]: row for row in response.json()}
+    assert str(retired.id) not in content
+    assert content[str(aircraft.id)] == {
+        "id": str(aircraft.id),
+        "registration": aircraft.registration,
+        "model": aircraft.model,
+        "capacity": 6,
+        "is_active": True,
+    }
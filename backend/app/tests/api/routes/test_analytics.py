@@ -0,0 +1,94 @@
+import uuid
+from datetime import datetime, timedelta
+
+from fastapi.testclient import TestClient
+from sqlmodel import Session
+
+from app.core.config import settings
+from app.tests.utils.load import create_random_aircraft, create_random_load
+
+
+def test_read_load_statistics_after_write(
+    client: TestClient, superuser_token_headers: dict[str, str], db: Session
+) -> None:
+    response = client.get(
+        f"{settings.API_V1_STR}/analytics/load-statistics",
+        headers=superuser_token_headers,
+    )
+    assert response.status_code == 200
+    before = response.json()
+
+    # A write through the loads router drops the cached statistics
+    aircraft = create_random_aircraft(db)
+    client.post(
+        f"{settings.API_V1_STR}/loads/",
+        headers=superuser_token_headers,
+        json={
+            "aircraft_id": str(aircraft.id),
+            "scheduled_time": (datetime.now() + timedelta(hours=3)).isoformat(),
+        },
+    )
+    response = client.get(
+        f"{settings.API_V1_STR}/analytics/load-statistics",
+        headers=superuser_token_headers,
+    )
+    after = response.json()
+    assert after["total_loads"] == before["total_loads"] + 1
+    assert after["planning"] == before["planning"] + 1
+
+
+def test_read_load_summary(
+    client: TestClient, superuser_token_headers: dict[str, str], db: Session
+) -> None:
+    load = create_random_load(db, capacity=4)
+    data = [
+        {
+            "load_id": str(load.id),
+            "jumper_name": f"Fun {n}",
+            "jump_type": "fun_jumper",
+            "exit_order": n,
+        }
+        for n in range(1, 3)
+    ]
+    client.post(
+        f"{settings.API_V1_STR}/jumps/bulk",
+        headers=superuser_token_headers,
+        json=data,
+    )
+    response = client.get(
+        f"{settings.API_V1_STR}/analytics/load-statistics/{load.id}",
+        headers=superuser_token_headers,
+    )
+    assert response.status_code == 200
+    content = response.json()
+    assert content["total_jumpers"] == 2
+    assert content["tandem_count"] == 0
+    assert content["aff_count"] == 0
+    assert content["fun_jumper_count"] == 2
+    assert content["capacity_utilization"] == 50.0
+    assert content["revenue_estimate"] == 50.0
+
+
+def test_read_load_summary_empty_load(
+    client: TestClient, superuser_token_headers: dict[str, str], db: Session
+) -> None:
+    load = create_random_load(db, capacity=4)
+    response = client.get(
+        f"{settings.API_V1_STR}/analytics/load-statistics/{load.id}",
+        headers=superuser_token_headers,
+    )
+    assert response.status_code == 200
+    content = response.json()
+    assert content["total_jumpers"] == 0
+    assert content["capacity_utilization"] == 0.0
+
+
+def test_read_load_summary_not_found(
+    client: TestClient, superuser_token_headers: dict[str, str]
+) -> None:
+    response = client.get(
+        f"{settings.API_V1_STR}/analytics/load-statistics/{uuid.uuid4()}",
+        headers=superuser_token_headers,
+    )
+    assert response.status_code == 404
+    assert response.json()["detail"] == "Load not found"
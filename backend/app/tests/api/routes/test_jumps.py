@@ -0,0 +1,190 @@
+import uuid
+
+from fastapi.testclient import TestClient
+from sqlmodel import Session
+
+from app.core.config import settings
+from app.tests.utils.load import create_random_load
+from app.tests.utils.utils import random_email
+
+
+def test_create_jumps_bulk(
+    client: TestClient, superuser_token_headers: dict[str, str], db: Session
+) -> None:
+    load = create_random_load(db, capacity=4)
+    response = client.post(
+        f"{settings.API_V1_STR}/instructors/",
+        headers=superuser_token_headers,
+        json={
+            "name": "Tandem Instructor",
+            "email": random_email(),
+            "tandem_certified": True,
+        },
+    )
+    assert response.status_code == 200
+    instructor = response.json()
+    data = [
+        {
+            "load_id": str(load.id),
+            "jumper_name": "Fun 1",
+            "jump_type": "fun_jumper",
+            "exit_order": 1,
+        },
+        {
+            "load_id": str(load.id),
+            "jumper_name": "Fun 2",
+            "jump_type": "fun_jumper",
+            "exit_order": 2,
+        },
+        {
+            "load_id": str(load.id),
+            "jumper_name": "Passenger",
+            "jump_type": "tandem",
+            "exit_order": 3,
+            "instructor_id": instructor["id"],
+        },
+    ]
+    response = client.post(
+        f"{settings.API_V1_STR}/jumps/bulk",
+        headers=superuser_token_headers,
+        json=data,
+    )
+    assert response.status_code == 200
+    assert response.json()["message"] == "3 jumps created successfully"
+
+    response = client.get(
+        f"{settings.API_V1_STR}/jumps/by-load/{load.id}",
+        headers=superuser_token_headers,
+    )
+    content = response.json()
+    assert content["count"] == 3
+    assert [jump["exit_order"] for jump in content["data"]] == [1, 2, 3]
+
+
+def test_create_jumps_bulk_over_capacity(
+    client: TestClient, superuser_token_headers: dict[str, str], db: Session
+) -> None:
+    load = create_random_load(db, capacity=2)
+    data = [
+        {
+            "load_id": str(load.id),
+            "jumper_name": f"Fun {n}",
+            "jump_type": "fun_jumper",
+            "exit_order": n,
+        }
+        for n in range(1, 4)
+    ]
+    response = client.post(
+        f"{settings.API_V1_STR}/jumps/bulk",
+        headers=superuser_token_headers,
+        json=data,
+    )
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Load is at full capacity"
+
+    response = client.get(
+        f"{settings.API_V1_STR}/jumps/by-load/{load.id}",
+        headers=superuser_token_headers,
+    )
+    assert response.json()["count"] == 0
+
+
+def test_create_jumps_bulk_tandem_requires_instructor(
+    client: TestClient, superuser_token_headers: dict[str, str], db: Session
+) -> None:
+    load = create_random_load(db)
+    data = [
+        {
+            "load_id": str(load.id),
+            "jumper_name": "Passenger",
+            "jump_type": "tandem",
+            "exit_order": 1,
+        }
+    ]
+    response = client.post(
+        f"{settings.API_V1_STR}/jumps/bulk",
+        headers=superuser_token_headers,
+        json=data,
+    )
+    assert response.status_code == 400
+    assert response.json()["detail"] == "tandem jumps require an instructor"
+
+
+def test_update_jump(
+    client: TestClient, superuser_token_headers: dict[str, str], db: Session
+) -> None:
+    load = create_random_load(db)
+    data = {
+        "load_id": str(load.id),
+        "jumper_name": "Fun 1",
+        "jump_type": "fun_jumper",
+        "exit_order": 1,
+    }
+    response = client.post(
+        f"{settings.API_V1_STR}/jumps/",
+        headers=superuser_token_headers,
+        json=data,
+    )
+    jump = response.json()
+    response = client.put(
+        f"{settings.API_V1_STR}/jumps/{jump['id']}",
+        headers=superuser_token_headers,
+        json={"exit_order": 2, "notes": "Camera flyer"},
+    )
+    assert response.status_code == 200
+    content = response.json()
+    assert content["id"] == jump["id"]
+    assert content["exit_order"] == 2
+    assert content["notes"] == "Camera flyer"
+    assert content["jumper_name"] == data["jumper_name"]
+    assert content["instructor"] is None
+
+
+def test_update_jump_not_found(
+    client: TestClient, superuser_token_headers: dict[str, str]
+) -> None:
+    response = client.put(
+        f"{settings.API_V1_STR}/jumps/{uuid.uuid4()}",
+        headers=superuser_token_headers,
+        json={"exit_order": 2},
+    )
+    assert response.status_code == 404
+    assert response.json()["detail"] == "Jump not found"
+
+
+def test_update_jump_uncertified_instructor(
+    client: TestClient, superuser_token_headers: dict[str, str], db: Session
+) -> None:
+    load = create_random_load(db)
+    response = client.post(
+        f"{settings.API_V1_STR}/instructors/",
+        headers=superuser_token_headers,
+        json={"name": "AFF Instructor", "email": random_email(), "aff_certified": True},
+    )
+    instructor = response.json()
+    data = {
+        "load_id": str(load.id),
+        "jumper_name": "Student",
+        "jump_type": "aff",
+        "exit_order": 1,
+        "instructor_id": instructor["id"],
+    }
+    response = client.post(
+        f"{settings.API_V1_STR}/jumps/",
+        headers=superuser_token_headers,
+        json=data,
+    )
+    jump = response.json()
+    response = client.put(
+        f"{settings.API_V1_STR}/jumps/{jump['id']}",
+        headers=superuser_token_headers,
+        json={"jump_type": "tandem"},
+    )
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Instructor not certified for tandem jumps"
+
+    response = client.get(
+        f"{settings.API_V1_STR}/jumps/{jump['id']}",
+        headers=superuser_token_headers,
+    )
+    assert response.json()["jump_type"] == "aff"
@@ -0,0 +1,125 @@
+import uuid
+from datetime import datetime, timedelta
+
+from fastapi.testclient import TestClient
+from sqlmodel import Session
+
+from app.core.config import settings
+from app.tests.utils.load import create_random_aircraft, create_random_load
+
+
+def test_update_load(
+    client: TestClient, superuser_token_headers: dict[str, str], db: Session
+) -> None:
+    load = create_random_load(db)
+    response = client.put(
+        f"{settings.API_V1_STR}/loads/{load.id}",
+        headers=superuser_token_headers,
+        json={"status": "confirmed", "notes": "Hop-n-pop"},
+    )
+    assert response.status_code == 200
+    content = response.json()
+    assert content["id"] == str(load.id)
+    assert content["status"] == "confirmed"
+    assert content["notes"] == "Hop-n-pop"
+    assert content["altitude"] == load.altitude
+    assert content["aircraft"]["id"] == str(load.aircraft_id)
+    assert content["jumps"] == []
+
+
+def test_update_load_not_found(
+    client: TestClient, superuser_token_headers: dict[str, str]
+) -> None:
+    response = client.put(
+        f"{settings.API_V1_STR}/loads/{uuid.uuid4()}",
+        headers=superuser_token_headers,
+        json={"status": "confirmed"},
+    )
+    assert response.status_code == 404
+    assert response.json()["detail"] == "Load not found"
+
+
+def test_read_load_not_modified(
+    client: TestClient, superuser_token_headers: dict[str, str], db: Session
+) -> None:
+    load = create_random_load(db)
+    response = client.get(
+        f"{settings.API_V1_STR}/loads/{load.id}", headers=superuser_token_headers
+    )
+    assert response.status_code == 200
+    etag = response.headers["etag"]
+
+    response = client.get(
+        f"{settings.API_V1_STR}/loads/{load.id}",
+        headers={**superuser_token_headers, "If-None-Match": etag},
+    )
+    assert response.status_code == 304
+    assert response.headers["etag"] == etag
+    assert response.content == b""
+
+
+def test_read_loads_cursor(
+    client: TestClient, superuser_token_headers: dict[str, str], db: Session
+) -> None:
+    for _ in range(3):
+        create_random_load(db)
+    response = client.get(
+        f"{settings.API_V1_STR}/loads/",
+        headers=superuser_token_headers,
+        params={"limit": 2},
+    )
+    assert response.status_code == 200
+    first_page = response.json()
+    assert len(first_page["data"]) == 2
+    assert first_page["count"] >= 3
+    assert first_page["next_cursor"]
+
+    response = client.get(
+        f"{settings.API_V1_STR}/loads/",
+        headers=superuser_token_headers,
+        params={"limit": 2, "cursor": first_page["next_cursor"]},
+    )
+    assert response.status_code == 200
+    second_page = response.json()
+    assert second_page["data"]
+    assert second_page["count"] is None
+    first_ids = {load["id"] for load in first_page["data"]}
+    assert not first_ids & {load["id"] for load in second_page["data"]}
+    last_time = first_page["data"][-1]["scheduled_time"]
+    assert last_time <= second_page["data"][0]["scheduled_time"]
+
+
+def test_read_loads_invalid_cursor(
+    client: TestClient, superuser_token_headers: dict[str, str]
+) -> None:
+    # Valid base64 and JSON, but the keys are not strings
+    response = client.get(
+        f"{settings.API_V1_STR}/loads/",
+        headers=superuser_token_headers,
+        params={"cursor": "WzEsIDJd"},
+    )
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Invalid cursor"
+
+
+def test_create_load(
+    client: TestClient, superuser_token_headers: dict[str, str], db: Session
+) -> None:
+    aircraft = create_random_aircraft(db)
+    data = {
+        "aircraft_id": str(aircraft.id),
+        "scheduled_time": (datetime.now() + timedelta(hours=2)).isoformat(),
+        "altitude": 13500,
+    }
+    response = client.post(
+        f"{settings.API_V1_STR}/loads/",
+        headers=superuser_token_headers,
+        json=data,
+    )
+    assert response.status_code == 200
+    content = response.json()
+    assert content["aircraft_id"] == data["aircraft_id"]
+    assert content["altitude"] == data["altitude"]
+    assert content["status"] == "planning"
+    assert content["aircraft"]["id"] == str(aircraft.id)
+    assert content["jumps"] == []
@@ -0,0 +1,162 @@
+import uuid
+from datetime import datetime, timedelta
+
+from fastapi.testclient import TestClient
+
+from app.core.config import settings
+
+
+def _report_data(date: datetime, wind_speed: int = 5) -> dict[str, object]:
+    return {
+        "date": date.isoformat(),
+        "wind_speed": wind_speed,
+        "wind_direction": 270,
+        "visibility": 10.0,
+        "condition": "good",
+    }
+
+
+def test_read_weather_reports_cursor(
+    client: TestClient, superuser_token_headers: dict[str, str]
+) -> None:
+    for _ in range(3):
+        client.post(
+            f"{settings.API_V1_STR}/weather/",
+            headers=superuser_token_headers,
+            json=_report_data(datetime.now()),
+        )
+    response = client.get(
+        f"{settings.API_V1_STR}/weather/",
+        headers=superuser_token_headers,
+        params={"limit": 2},
+    )
+    assert response.status_code == 200
+    first_page = response.json()
+    assert len(first_page["data"]) == 2
+    assert first_page["count"] >= 3
+    assert first_page["next_cursor"]
+
+    response = client.get(
+        f"{settings.API_V1_STR}/weather/",
+        headers=superuser_token_headers,
+        params={"limit": 2, "cursor": first_page["next_cursor"]},
+    )
+    assert response.status_code == 200
+    second_page = response.json()
+    assert second_page["data"]
+    assert second_page["count"] is None
+    first_ids = {report["id"] for report in first_page["data"]}
+    assert not first_ids & {report["id"] for report in second_page["data"]}
+    assert first_page["data"][-1]["date"] >= second_page["data"][0]["date"]
+
+
+def test_read_weather_reports_invalid_cursor(
+    client: TestClient, superuser_token_headers: dict[str, str]
+) -> None:
+    response = client.get(
+        f"{settings.API_V1_STR}/weather/",
+        headers=superuser_token_headers,
+        params={"cursor": "not-a-cursor"},
+    )
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Invalid cursor"
+
+
+def test_read_current_weather_after_write(
+    client: TestClient, superuser_token_headers: dict[str, str]
+) -> None:
+    client.post(
+        f"{settings.API_V1_STR}/weather/",
+        headers=superuser_token_headers,
+        json=_report_data(datetime.now() + timedelta(days=1), wind_speed=7),
+    )
+    response = client.get(
+        f"{settings.API_V1_STR}/weather/current/", headers=superuser_token_headers
+    )
+    assert response.status_code == 200
+    assert response.json()["wind_speed"] == 7
+
+    # The write drops the cached latest report instead of waiting for its TTL
+    client.post(
+        f"{settings.API_V1_STR}/weather/",
+        headers=superuser_token_headers,
+        json=_report_data(datetime.now() + timedelta(days=2), wind_speed=12),
+    )
+    response = client.get(
+        f"{settings.API_V1_STR}/weather/current/", headers=superuser_token_headers
+    )
+    assert response.status_code == 200
+    assert response.json()["wind_speed"] == 12
+
+
+def test_create_weather_report(
+    client: TestClient, superuser_token_headers: dict[str, str]
+) -> None:
+    data = _report_data(datetime.now())
+    response = client.post(
+        f"{settings.API_V1_STR}/weather/",
+        headers=superuser_token_headers,
+        json=data,
+    )
+    assert response.status_code == 200
+    content = response.json()
+    assert content["wind_speed"] == data["wind_speed"]
+    assert content["condition"] == data["condition"]
+    assert "id" in content
+
+
+def test_read_current_weather_not_modified(
+    client: TestClient, superuser_token_headers: dict[str, str]
+) -> None:
+    client.post(
+        f"{settings.API_V1_STR}/weather/",
+        headers=superuser_token_headers,
+        json=_report_data(datetime.now() + timedelta(days=3)),
+    )
+    response = client.get(
+        f"{settings.API_V1_STR}/weather/current/", headers=superuser_token_headers
+    )
+    assert response.status_code == 200
+    etag = response.headers["etag"]
+
+    response = client.get(
+        f"{settings.API_V1_STR}/weather/current/",
+        headers={**superuser_token_headers, "If-None-Match": etag},
+    )
+    assert response.status_code == 304
+    assert response.headers["etag"] == etag
+    assert response.content == b""
+
+
+def test_update_weather_report(
+    client: TestClient, superuser_token_headers: dict[str, str]
+) -> None:
+    response = client.post(
+        f"{settings.API_V1_STR}/weather/",
+        headers=superuser_token_headers,
+        json=_report_data(datetime.now()),
+    )
+    report = response.json()
+    response = client.put(
+        f"{settings.API_V1_STR}/weather/{report['id']}",
+        headers=superuser_token_headers,
+        json={"wind_speed": 25, "condition": "marginal"},
+    )
+    assert response.status_code == 200
+    content = response.json()
+    assert content["id"] == report["id"]
+    assert content["wind_speed"] == 25
+    assert content["condition"] == "marginal"
+    assert content["visibility"] == report["visibility"]
+
+
+def test_update_weather_report_not_found(
+    client: TestClient, superuser_token_headers: dict[str, str]
+) -> None:
+    response = client.put(
+        f"{settings.API_V1_STR}/weather/{uuid.uuid4()}",
+        headers=superuser_token_headers,
+        json={"wind_speed": 25},
+    )
+    assert response.status_code == 404
+    assert response.json()["detail"] == "Weather report not found"
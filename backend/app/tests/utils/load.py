@@ -0,0 +1,25 @@
+from datetime import datetime, timedelta
+
+from sqlmodel import Session
+
+from app import crud
+from app.models import Aircraft, AircraftCreate, Load, LoadCreate
+from app.tests.utils.utils import random_lower_string
+
+
+def create_random_aircraft(db: Session, capacity: int = 4) -> Aircraft:
+    aircraft_in = AircraftCreate(
+        registration=random_lower_string()[:20],
+        model="Cessna 182",
+        capacity=capacity,
+    )
+    return crud.create_aircraft(session=db, aircraft_in=aircraft_in)
+
+
+def create_random_load(db: Session, capacity: int = 4) -> Load:
+    aircraft = create_random_aircraft(db, capacity=capacity)
+    load_in = LoadCreate(
+        aircraft_id=aircraft.id,
+        scheduled_time=datetime.now() + timedelta(hours=1),
+    )
+    return crud.create_load(session=db, load_in=load_in)